@@ -2,13 +2,19 @@
 
 import os
 import time
+import atexit
 import sys
 import random
 import json
+import codecs
+import re
+from collections import deque
+from itertools import cycle
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import IntEnum
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Deque, Set
 from abc import ABC, abstractmethod
 
 
@@ -103,10 +109,8 @@ class Style:
 
     @staticmethod
     def gradient_text(text: str, colors: list) -> str:
-        result = ""
-        for i, char in enumerate(text):
-            color = colors[i % len(colors)]
-            result += f"{color}{char}"
+        n = len(colors)
+        result = "".join(f"{colors[i % n]}{char}" for i, char in enumerate(text))
         return f"{result}{Style.RESET}"
 
     @staticmethod
@@ -145,8 +149,11 @@ class HighScoreManager:
     def __init__(self, save_file: str = "gemini_scores.json"):
         self.save_file = Path.home() / ".gemini_arcade" / save_file
         self.scores: Dict[str, int] = {}
+        self._dirty = False
         self._ensure_directory()
         self.load()
+        # New records are only marked dirty mid-game; write anything still pending on exit
+        atexit.register(self.flush)
 
     def _ensure_directory(self):
         """Create save directory if it doesn't exist"""
@@ -164,12 +171,22 @@ class HighScoreManager:
 
     def save(self):
         """Save high scores to file"""
+        # Write a sibling temp file and swap it in, so a crash mid-write never
+        # leaves a truncated scores file behind
+        tmp_file = self.save_file.with_suffix('.tmp')
         try:
-            with open(self.save_file, 'w') as f:
-                json.dump(self.scores, f, indent=2)
+            with open(tmp_file, 'w') as f:
+                json.dump(self.scores, f, separators=(',', ':'))
+            os.replace(tmp_file, self.save_file)
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Could not save high scores: {e}")
 
+    def flush(self):
+        """Save high scores if any changed since the last save"""
+        if self._dirty:
+            self.save()
+
     def get_high_score(self, game_name: str) -> int:
         """Get high score for a game"""
         return self.scores.get(game_name, 0)
@@ -179,18 +196,147 @@ class HighScoreManager:
         current = self.get_high_score(game_name)
         if score > current:
             self.scores[game_name] = score
-            self.save()
+            self._dirty = True
             return True
         return False
 
 
+# Rendered VRAM cells, indexed by DisplayChar value
+_CELL_TEXT = (
+    '  ',                                     # EMPTY
+    f'{Style.DIM}░░{Style.RESET}',            # LIGHT
+    f' {Style.WHITE}.{Style.RESET}',          # MEDIUM
+    f'{Style.BRIGHT_YELLOW}●{Style.RESET} ',  # HEAVY
+    f'{Style.BLUE}▓▓{Style.RESET}',           # WALL
+    f'{Style.BRIGHT_GREEN}● {Style.RESET}',   # FOOD
+    f'{Style.CYAN}▒▒{Style.RESET}',           # PADDLE
+    f'{Style.YELLOW}● {Style.RESET}',         # BALL
+    f'{Style.GREEN}● {Style.RESET}',          # SNAKE_BODY
+    f'{Style.BRIGHT_GREEN}★★{Style.RESET}',   # SNAKE_HEAD
+    f'{Style.RED}▓▓{Style.RESET}',            # BRICK
+    f'{Style.MAGENTA}▒▒{Style.RESET}',        # CAR
+    f'{Style.RED}▓▓{Style.RESET}',            # OBSTACLE
+    f'{Style.ORANGE}▓▓{Style.RESET}',         # AI_CAR
+    f'{Style.GOLD}▓▓{Style.RESET}',           # FINISH
+    f'{Style.BRIGHT_YELLOW}● {Style.RESET}',  # PACMAN
+)
+_UNKNOWN_CELL = '██'
+
+# Flat table indexed directly by the VRAM byte, pre-encoded for the frame writer
+_CHAR_MAP = tuple(
+    (_CELL_TEXT[value] if value < len(_CELL_TEXT) else _UNKNOWN_CELL).encode()
+    for value in range(256)
+)
+
+# Checkerboard backdrop for EMPTY cells
+_EMPTY_EVEN = f"{Style.DIM}. {Style.RESET}".encode()
+_EMPTY_ODD = f"{Style.DIM}  {Style.RESET}".encode()
+
+# Full 256-entry cell tables for even and odd checkerboard squares, so a VRAM
+# row can be turned into bytes with map() without a Python-level loop per cell
+_CELL_TABLES = tuple(
+    _CHAR_MAP[:DisplayChar.EMPTY] + (empty,) + _CHAR_MAP[DisplayChar.EMPTY + 1:]
+    for empty in (_EMPTY_EVEN, _EMPTY_ODD)
+)
+
+
+# ASCII cells and backdrop used instead when stdout is redirected to a file or pipe
+_PLAIN_CELL_TEXT = (
+    '  ',  # EMPTY
+    '..',  # LIGHT
+    ' .',  # MEDIUM
+    'o ',  # HEAVY
+    '##',  # WALL
+    '* ',  # FOOD
+    '==',  # PADDLE
+    'o ',  # BALL
+    'o ',  # SNAKE_BODY
+    '@@',  # SNAKE_HEAD
+    '[]',  # BRICK
+    'AA',  # CAR
+    'XX',  # OBSTACLE
+    'VV',  # AI_CAR
+    '::',  # FINISH
+    'C ',  # PACMAN
+)
+_PLAIN_UNKNOWN_CELL = '??'
+_PLAIN_CHAR_MAP = tuple(
+    (_PLAIN_CELL_TEXT[value] if value < len(_PLAIN_CELL_TEXT) else _PLAIN_UNKNOWN_CELL).encode()
+    for value in range(256)
+)
+_PLAIN_CELL_TABLES = tuple(
+    _PLAIN_CHAR_MAP[:DisplayChar.EMPTY] + (empty,) + _PLAIN_CHAR_MAP[DisplayChar.EMPTY + 1:]
+    for empty in (b". ", b"  ")
+)
+
+# SGR color/attribute sequences, stripped from the frame pieces in plain mode
+_SGR = re.compile(rb"\033\[[0-9;]*m")
+
+
+# Status rows only change on scoring events, so each distinct row is built once
+@lru_cache(maxsize=1024)
+def _score_row(score: int, high_score: int, playfield_width: int) -> bytes:
+    """Build the encoded SCORE/HIGH status row"""
+    border_color = Style.BRIGHT_CYAN
+    score_color = Style.BRIGHT_GREEN
+    high_color = Style.BRIGHT_MAGENTA
+    score_label = " SCORE "
+    high_label = " HIGH "
+    visible_score_len = len(f"{score_label}{score:<4}   {high_label}{high_score:<4}")
+    pad_total = max(0, playfield_width - visible_score_len)
+    left_pad = pad_total // 2
+    right_pad = pad_total - left_pad
+    score_text = (
+        f"{Style.BRIGHT_WHITE}{score_label}{Style.RESET}"
+        f"{score_color}{score:<4}{Style.RESET}"
+        f"   {Style.BRIGHT_WHITE}{high_label}{Style.RESET}"
+        f"{high_color}{high_score:<4}{Style.RESET}"
+    )
+    return f"{border_color}║{Style.RESET}{' ' * left_pad}{score_text}{' ' * right_pad}{border_color}║{Style.RESET}\n".encode()
+
+
+@lru_cache(maxsize=8)
+def _paused_row(playfield_width: int) -> bytes:
+    """Build the encoded PAUSED badge row"""
+    border_color = Style.BRIGHT_CYAN
+    paused_text = "== PAUSED =="
+    visible_paused_len = len(paused_text)
+    paused_pad = max(0, playfield_width - visible_paused_len)
+    paused_left = paused_pad // 2
+    paused_right = paused_pad - paused_left
+    paused_badge = f"{Style.BRIGHT_RED}{Style.BLINK}{paused_text}{Style.RESET}"
+    return f"{border_color}║{Style.RESET}{' ' * paused_left}{paused_badge}{' ' * paused_right}{border_color}║{Style.RESET}\n".encode()
+
+
+@lru_cache(maxsize=256)
+def _info_row(info: str, playfield_width: int) -> bytes:
+    """Build the encoded per-game info row"""
+    border_color = Style.BRIGHT_CYAN
+    info_color = Style.BRIGHT_WHITE
+    return f"{border_color}║{Style.RESET}{info_color}{info:^{playfield_width}}{Style.RESET}{border_color}║{Style.RESET}\n".encode()
+
+
+@lru_cache(maxsize=1024)
+def _plain_row(row: bytes) -> bytes:
+    """Strip the colors from a cached status row for plain output"""
+    return _SGR.sub(b"", row)
+
+
 class GeminiCPU:
     """8-bit CPU with 256 bytes of memory and basic I/O"""
+    __slots__ = ('A', 'B', 'C', 'D', 'PC', 'SP', 'zero_flag', 'carry_flag', 'running',
+                 'memory', 'last_input', 'cycles', 'FB_WIDTH', 'FB_HEIGHT', 'VRAM_SIZE',
+                 '_empty_vram', '_dispatch', '_prelude_cache', '_postlude', '_separator',
+                 '_row_left', '_row_right', '_last_frame_key', '_row_cache',
+                 '_status_lines', '_cell_cursor', '_ansi', '_cell_tables')
 
     SCORE_ADDR = 0x100
     HIGH_SCORE_ADDR = 0x101
     VRAM_START = 0x200
     STACK_TOP = 0xFF
+    ROW_CACHE_LIMIT = 4096
+    GRID_TOP = 5        # terminal line of the first VRAM row (after shadow, border, title, separator)
+    POSTLUDE_LINES = 5  # separator, two controls rows, bottom border, shadow
 
     def __init__(self, framebuffer_width: int = 16, framebuffer_height: int = 16):
         self.FB_WIDTH = framebuffer_width
@@ -198,16 +344,15 @@ class GeminiCPU:
         self.VRAM_SIZE = framebuffer_width * framebuffer_height
 
         mem_size = self.VRAM_START + self.VRAM_SIZE + 256
-        self.memory = [0] * mem_size
-
-        self.reg = {
-            'A': 0,
-            'B': 0,
-            'C': 0,
-            'D': 0,
-            'PC': 0,
-            'SP': self.STACK_TOP
-        }
+        self.memory = bytearray(mem_size)
+        self._empty_vram = bytes([DisplayChar.EMPTY]) * self.VRAM_SIZE
+
+        self.A = 0
+        self.B = 0
+        self.C = 0
+        self.D = 0
+        self.PC = 0
+        self.SP = self.STACK_TOP
         self.zero_flag = False
         self.carry_flag = False
         self.running = True
@@ -215,16 +360,36 @@ class GeminiCPU:
         self.last_input = 0
         self.cycles = 0
 
-    def render(self, title: str = "GEMINI", paused: bool = False, info: str = ""):
-        """Render the display using ANSI codes"""
-        print("\033[H\033[J", end='', flush=True)
+        self._dispatch = self._build_dispatch()
+
+        # Frame pieces that only depend on the framebuffer size (and title)
+        self._prelude_cache: Dict[str, bytes] = {}
+        self._postlude = self._build_postlude().encode()
+        self._separator = f"{Style.BRIGHT_CYAN}╠{'═' * (self.FB_WIDTH * 2)}╣{Style.RESET}\n".encode()
+        self._row_left = f"{Style.BRIGHT_CYAN}║{Style.RESET}".encode()
+        self._row_right = f"{Style.BRIGHT_CYAN}║{Style.RESET}\n".encode()
+        self._last_frame_key = None
+        self._row_cache: Dict[Tuple[int, bytes], bytes] = {}
+        self._status_lines = 0
+        self._cell_cursor = tuple(
+            f"\033[{self.GRID_TOP + y};{2 + 2 * x}H".encode()
+            for y in range(self.FB_HEIGHT) for x in range(self.FB_WIDTH)
+        )
 
+        # Redirected output gets ASCII cells and uncolored borders, decided once up front
+        self._ansi = sys.stdout.isatty()
+        self._cell_tables = _CELL_TABLES if self._ansi else _PLAIN_CELL_TABLES
+        if not self._ansi:
+            self._postlude = _SGR.sub(b"", self._postlude)
+            self._separator = _SGR.sub(b"", self._separator)
+            self._row_left = _SGR.sub(b"", self._row_left)
+            self._row_right = _SGR.sub(b"", self._row_right)
+
+    def _build_prelude(self, title: str) -> str:
+        """Build the static rows above the playfield for a given title"""
         playfield_width = self.FB_WIDTH * 2
         border_color = Style.BRIGHT_CYAN
         shadow_color = Style.BRIGHT_BLACK
-        score_color = Style.BRIGHT_GREEN
-        high_color = Style.BRIGHT_MAGENTA
-        info_color = Style.BRIGHT_WHITE
         title_palette = [
             Style.BRIGHT_MAGENTA,
             Style.BRIGHT_BLUE,
@@ -233,80 +398,23 @@ class GeminiCPU:
             Style.BRIGHT_YELLOW,
         ]
 
-        print(f"{shadow_color}{'▄' * (playfield_width + 2)}{Style.RESET}")
-        print(f"{border_color}╔{'═' * playfield_width}╗{Style.RESET}")
-
         title_plain = f"◉ {title} ◉"
         title_colored = Style.gradient_text(title_plain, title_palette)
         left_pad = max(0, (playfield_width - len(title_plain)) // 2)
         right_pad = max(0, playfield_width - left_pad - len(title_plain))
-        print(f"{border_color}║{Style.RESET}{' ' * left_pad}{title_colored}{' ' * right_pad}{border_color}║{Style.RESET}")
-        print(f"{border_color}╠{'═' * playfield_width}╣{Style.RESET}")
-
-        char_map = {
-            0: '  ',
-            1: f'{Style.DIM}░░{Style.RESET}',
-            2: f' {Style.WHITE}.{Style.RESET}',
-            3: f'{Style.BRIGHT_YELLOW}●{Style.RESET} ',
-            4: f'{Style.BLUE}▓▓{Style.RESET}',
-            5: f'{Style.BRIGHT_GREEN}● {Style.RESET}',
-            6: f'{Style.CYAN}▒▒{Style.RESET}',
-            7: f'{Style.YELLOW}● {Style.RESET}',
-            8: f'{Style.GREEN}● {Style.RESET}',
-            9: f'{Style.BRIGHT_GREEN}★★{Style.RESET}',
-            10: f'{Style.RED}▓▓{Style.RESET}',
-            11: f'{Style.MAGENTA}▒▒{Style.RESET}',
-            12: f'{Style.RED}▓▓{Style.RESET}',
-            13: f'{Style.ORANGE}▓▓{Style.RESET}',
-            14: f'{Style.GOLD}▓▓{Style.RESET}',
-            15: f'{Style.BRIGHT_YELLOW}● {Style.RESET}',
-        }
-
-        for y in range(self.FB_HEIGHT):
-            print(f"{border_color}║{Style.RESET}", end='')
-            for x in range(self.FB_WIDTH):
-                addr = self.VRAM_START + (y * self.FB_WIDTH) + x
-                val = self.memory[addr]
-                if val == DisplayChar.EMPTY:
-                    checker = (x + y) % 2 == 0
-                    char = f"{Style.DIM}{'. ' if checker else '  '}{Style.RESET}"
-                else:
-                    char = char_map.get(val, '██')
-                print(char, end='')
-            print(f"{border_color}║{Style.RESET}")
-
-        print(f"{border_color}╠{'═' * playfield_width}╣{Style.RESET}")
-
-        score = self.memory[self.SCORE_ADDR]
-        high_score = self.memory[self.HIGH_SCORE_ADDR]
-        score_label = " SCORE "
-        high_label = " HIGH "
-        visible_score_len = len(f"{score_label}{score:<4}   {high_label}{high_score:<4}")
-        pad_total = max(0, playfield_width - visible_score_len)
-        left_pad = pad_total // 2
-        right_pad = pad_total - left_pad
-        score_text = (
-            f"{Style.BRIGHT_WHITE}{score_label}{Style.RESET}"
-            f"{score_color}{score:<4}{Style.RESET}"
-            f"   {Style.BRIGHT_WHITE}{high_label}{Style.RESET}"
-            f"{high_color}{high_score:<4}{Style.RESET}"
+        return (
+            f"{shadow_color}{'▄' * (playfield_width + 2)}{Style.RESET}\n"
+            f"{border_color}╔{'═' * playfield_width}╗{Style.RESET}\n"
+            f"{border_color}║{Style.RESET}{' ' * left_pad}{title_colored}{' ' * right_pad}{border_color}║{Style.RESET}\n"
+            f"{border_color}╠{'═' * playfield_width}╣{Style.RESET}\n"
         )
-        print(f"{border_color}║{Style.RESET}{' ' * left_pad}{score_text}{' ' * right_pad}{border_color}║{Style.RESET}")
-
-        if paused:
-            paused_text = "== PAUSED =="
-            visible_paused_len = len(paused_text)
-            paused_pad = max(0, playfield_width - visible_paused_len)
-            paused_left = paused_pad // 2
-            paused_right = paused_pad - paused_left
-            paused_badge = f"{Style.BRIGHT_RED}{Style.BLINK}{paused_text}{Style.RESET}"
-            print(f"{border_color}║{Style.RESET}{' ' * paused_left}{paused_badge}{' ' * paused_right}{border_color}║{Style.RESET}")
 
-        if info:
-            print(f"{border_color}║{Style.RESET}{info_color}{info:^{playfield_width}}{Style.RESET}{border_color}║{Style.RESET}")
+    def _build_postlude(self) -> str:
+        """Build the static controls and bottom border rows below the status area"""
+        playfield_width = self.FB_WIDTH * 2
+        border_color = Style.BRIGHT_CYAN
+        shadow_color = Style.BRIGHT_BLACK
 
-        print(f"{border_color}╠{'═' * playfield_width}╣{Style.RESET}")
-        
         # Two-line centered controls display (max 32 chars wide)
         labels = "Move    Pause   Reset   Quit"
         keys = "←↑↓→      P       R       Q"
@@ -321,158 +429,341 @@ class GeminiCPU:
         keys_pad = max(0, playfield_width - visible_keys_len)
         keys_left = keys_pad // 2
         keys_right = keys_pad - keys_left
-        
-        print(
+
+        return (
+            f"{border_color}╠{'═' * playfield_width}╣{Style.RESET}\n"
             f"{border_color}║{Style.RESET}"
             f"{' ' * label_left}{Style.DIM}{labels}{Style.RESET}{' ' * label_right}"
-            f"{border_color}║{Style.RESET}"
-        )
-        print(
+            f"{border_color}║{Style.RESET}\n"
             f"{border_color}║{Style.RESET}"
             f"{' ' * keys_left}{Style.DIM}{keys}{Style.RESET}{' ' * keys_right}"
-            f"{border_color}║{Style.RESET}"
+            f"{border_color}║{Style.RESET}\n"
+            f"{border_color}╚{'═' * playfield_width}╝{Style.RESET}\n"
+            f"{shadow_color}{'▀' * (playfield_width + 2)}{Style.RESET}\n"
         )
-        print(f"{border_color}╚{'═' * playfield_width}╝{Style.RESET}")
-        print(f"{shadow_color}{'▀' * (playfield_width + 2)}{Style.RESET}")
+
+    def render(self, title: str = "GEMINI", paused: bool = False, info: str = ""):
+        """Render the display using ANSI codes.
+
+        The first frame (and any frame after invalidate_display() or a title change) is a
+        full clear-and-redraw. Later frames only reposition the cursor onto VRAM cells that
+        changed, and redraw the status block below the playfield if it changed. When stdout
+        is not a terminal, every changed frame is written whole as plain text instead.
+        """
+        memory = self.memory
+        vram_start = self.VRAM_START
+        vram = bytes(memory[vram_start:vram_start + self.VRAM_SIZE])
+        status = (memory[self.SCORE_ADDR], memory[self.HIGH_SCORE_ADDR], paused, info)
+        frame_key = (title, status, vram)
+        last = self._last_frame_key
+        # Skip the redraw entirely when nothing visible changed since the last frame
+        if frame_key == last:
+            return
+        self._last_frame_key = frame_key
+
+        if last is None or last[0] != title or not self._ansi:
+            _write_bytes(self._full_frame(title, vram, status))
+            return
+
+        out = bytearray()
+        last_vram = last[2]
+        if vram != last_vram:
+            width = self.FB_WIDTH
+            tables = self._cell_tables
+            cell_cursor = self._cell_cursor
+            for y in range(self.FB_HEIGHT):
+                base = y * width
+                if vram[base:base + width] == last_vram[base:base + width]:
+                    continue
+                cursor_x = -1
+                for x in range(width):
+                    i = base + x
+                    val = vram[i]
+                    if val != last_vram[i]:
+                        # Runs of adjacent changed cells share a single cursor move
+                        if x != cursor_x:
+                            out += cell_cursor[i]
+                        out += tables[(x + y) & 1][val]
+                        cursor_x = x + 1
+
+        status_line = self.GRID_TOP + self.FB_HEIGHT
+        if status != last[1]:
+            # Erase the old status rows first: the new block may be shorter or fewer rows
+            out += f"\033[{status_line};1H\033[J".encode()
+            out += self._status_block(*status)
+        else:
+            out += f"\033[{status_line + self._status_lines};1H".encode()
+
+        _write_bytes(out)
+
+    def invalidate_display(self):
+        """Force the next render() to repaint the whole frame (e.g. after other output)"""
+        self._last_frame_key = None
+
+    def _full_frame(self, title: str, vram: bytes, status: tuple) -> bytearray:
+        """Build a complete clear-and-redraw frame (a blank-line-separated one in plain mode)"""
+        prelude = self._prelude_cache.get(title)
+        if prelude is None:
+            prelude = self._build_prelude(title).encode()
+            if not self._ansi:
+                prelude = _SGR.sub(b"", prelude)
+            self._prelude_cache[title] = prelude
+        out = bytearray(b"\033[H\033[J" if self._ansi else b"\n")
+        out += prelude
+
+        # Rows are cached by (checkerboard parity, row bytes); unchanged rows cost one dict hit
+        row_cache = self._row_cache
+        width = self.FB_WIDTH
+        for y in range(self.FB_HEIGHT):
+            base = y * width
+            key = (y & 1, vram[base:base + width])
+            row = row_cache.get(key)
+            if row is None:
+                if len(row_cache) >= self.ROW_CACHE_LIMIT:
+                    row_cache.clear()
+                row = row_cache[key] = self._render_row(*key)
+            out += row
+
+        out += self._status_block(*status)
+        return out
+
+    def _status_block(self, score: int, high_score: int, paused: bool, info: str) -> bytearray:
+        """Build everything below the playfield: status rows, controls and bottom border"""
+        playfield_width = self.FB_WIDTH * 2
+        rows = [_score_row(score, high_score, playfield_width)]
+        if paused:
+            rows.append(_paused_row(playfield_width))
+        if info:
+            rows.append(_info_row(info, playfield_width))
+        if not self._ansi:
+            rows = [_plain_row(row) for row in rows]
+        out = bytearray(self._separator)
+        out += b"".join(rows)
+        out += self._postlude
+        self._status_lines = len(rows) + 1 + self.POSTLUDE_LINES
+        return out
+
+    def _render_row(self, parity: int, cells: bytes) -> bytes:
+        """Render one VRAM row, including its side borders"""
+        even, odd = self._cell_tables
+        tables = (even, odd) if parity == 0 else (odd, even)
+        return self._row_left + b''.join(map(tuple.__getitem__, cycle(tables), cells)) + self._row_right
+
+    def _build_dispatch(self) -> list:
+        """Build the opcode-indexed handler table used by step()"""
+        dispatch = [self._op_nop] * 256
+        dispatch[Opcode.LDA_IMM] = self._op_lda_imm
+        dispatch[Opcode.STA_ABS] = self._op_sta_abs
+        dispatch[Opcode.ADD] = self._op_add
+        dispatch[Opcode.LDB_IMM] = self._op_ldb_imm
+        dispatch[Opcode.CMP] = self._op_cmp
+        dispatch[Opcode.JMP] = self._op_jmp
+        dispatch[Opcode.JZ] = self._op_jz
+        dispatch[Opcode.INP] = self._op_inp
+        dispatch[Opcode.SUB] = self._op_sub
+        dispatch[Opcode.LDC_IMM] = self._op_ldc_imm
+        dispatch[Opcode.LDD_IMM] = self._op_ldd_imm
+        dispatch[Opcode.INC] = self._op_inc
+        dispatch[Opcode.DEC] = self._op_dec
+        dispatch[Opcode.JNZ] = self._op_jnz
+        dispatch[Opcode.LDA_ABS] = self._op_lda_abs
+        dispatch[Opcode.LDA_IDX] = self._op_lda_idx
+        dispatch[Opcode.STA_IDX] = self._op_sta_idx
+        dispatch[Opcode.CALL] = self._op_call
+        dispatch[Opcode.RET] = self._op_ret
+        dispatch[Opcode.MOV_BA] = self._op_mov_ba
+        dispatch[Opcode.MOV_AB] = self._op_mov_ab
+        dispatch[Opcode.MOV_CA] = self._op_mov_ca
+        dispatch[Opcode.MOV_AC] = self._op_mov_ac
+        dispatch[Opcode.MOV_DA] = self._op_mov_da
+        dispatch[Opcode.MOV_AD] = self._op_mov_ad
+        dispatch[Opcode.AND] = self._op_and
+        dispatch[Opcode.OR] = self._op_or
+        dispatch[Opcode.HALT] = self._op_halt
+        return dispatch
 
     def step(self):
         """Execute one instruction"""
-        pc = self.reg['PC']
+        pc = self.PC
         if pc >= len(self.memory):
             self.running = False
             return
 
-        opcode = self.memory[pc]
         self.cycles += 1
+        self._dispatch[self.memory[pc]](pc)
+
+    def run(self, max_cycles: int) -> int:
+        """Execute up to max_cycles instructions in a batch. Returns the number executed."""
+        memory = self.memory
+        mem_len = len(memory)
+        dispatch = self._dispatch
+        executed = 0
+        while self.running and executed < max_cycles:
+            pc = self.PC
+            if pc >= mem_len:
+                self.running = False
+                break
+            dispatch[memory[pc]](pc)
+            executed += 1
+        self.cycles += executed
+        return executed
+
+    # Opcode handlers: each receives the PC of the opcode byte and advances PC itself.
+    # Unknown opcodes are treated as NOP.
+
+    def _op_nop(self, pc: int):
+        self.PC += 1
+
+    def _op_lda_imm(self, pc: int):
+        self.A = self.memory[pc + 1]
+        self.PC += 2
+
+    def _op_sta_abs(self, pc: int):
+        mem = self.memory
+        addr = mem[pc + 1] | (mem[pc + 2] << 8)
+        if addr < len(mem):
+            mem[addr] = self.A
+        self.PC += 3
+
+    def _op_add(self, pc: int):
+        result = self.A + self.B
+        self.carry_flag = result > 0xFF
+        self.A = result & 0xFF
+        self.zero_flag = self.A == 0
+        self.PC += 1
+
+    def _op_ldb_imm(self, pc: int):
+        self.B = self.memory[pc + 1]
+        self.PC += 2
+
+    def _op_cmp(self, pc: int):
+        self.zero_flag = (self.A == self.B)
+        self.PC += 1
+
+    def _op_jmp(self, pc: int):
+        mem = self.memory
+        self.PC = mem[pc + 1] | (mem[pc + 2] << 8)
+
+    def _op_jz(self, pc: int):
+        if self.zero_flag:
+            mem = self.memory
+            self.PC = mem[pc + 1] | (mem[pc + 2] << 8)
+        else:
+            self.PC += 3
 
-        if opcode == Opcode.NOP:
-            self.reg['PC'] += 1
-        elif opcode == Opcode.LDA_IMM:
-            self.reg['A'] = self.memory[pc + 1]
-            self.reg['PC'] += 2
-        elif opcode == Opcode.STA_ABS:
-            addr = self._read_address(pc + 1)
-            if addr < len(self.memory):
-                self.memory[addr] = self.reg['A']
-            self.reg['PC'] += 3
-        elif opcode == Opcode.ADD:
-            result = self.reg['A'] + self.reg['B']
-            self.carry_flag = result > 0xFF
-            self.reg['A'] = result & 0xFF
-            self.zero_flag = self.reg['A'] == 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.LDB_IMM:
-            self.reg['B'] = self.memory[pc + 1]
-            self.reg['PC'] += 2
-        elif opcode == Opcode.CMP:
-            self.zero_flag = (self.reg['A'] == self.reg['B'])
-            self.reg['PC'] += 1
-        elif opcode == Opcode.JMP:
-            self.reg['PC'] = self._read_address(pc + 1)
-        elif opcode == Opcode.JZ:
-            if self.zero_flag:
-                self.reg['PC'] = self._read_address(pc + 1)
-            else:
-                self.reg['PC'] += 3
-        elif opcode == Opcode.INP:
-            self.reg['A'] = self.last_input if self.last_input != 0 else 0
-            self.last_input = 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.SUB:
-            result = self.reg['A'] - self.reg['B']
-            self.carry_flag = result < 0
-            self.reg['A'] = result & 0xFF
-            self.zero_flag = self.reg['A'] == 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.LDC_IMM:
-            self.reg['C'] = self.memory[pc + 1]
-            self.reg['PC'] += 2
-        elif opcode == Opcode.LDD_IMM:
-            self.reg['D'] = self.memory[pc + 1]
-            self.reg['PC'] += 2
-        elif opcode == Opcode.INC:
-            self.reg['A'] = (self.reg['A'] + 1) & 0xFF
-            self.zero_flag = self.reg['A'] == 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.DEC:
-            self.reg['A'] = (self.reg['A'] - 1) & 0xFF
-            self.zero_flag = self.reg['A'] == 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.JNZ:
-            if not self.zero_flag:
-                self.reg['PC'] = self._read_address(pc + 1)
-            else:
-                self.reg['PC'] += 3
-        elif opcode == Opcode.LDA_ABS:
-            addr = self._read_address(pc + 1)
-            if addr < len(self.memory):
-                self.reg['A'] = self.memory[addr]
-            self.reg['PC'] += 3
-        elif opcode == Opcode.LDA_IDX:
-            addr = self.reg['B'] + self.reg['C']
-            if addr < len(self.memory):
-                self.reg['A'] = self.memory[addr]
-            self.reg['PC'] += 1
-        elif opcode == Opcode.STA_IDX:
-            addr = self.reg['B'] + self.reg['C']
-            if addr < len(self.memory):
-                self.memory[addr] = self.reg['A']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.CALL:
-            ret_addr = pc + 3
-            self._push(ret_addr)
-            self.reg['PC'] = self._read_address(pc + 1)
-        elif opcode == Opcode.RET:
-            self.reg['PC'] = self._pop()
-        elif opcode == Opcode.MOV_BA:
-            self.reg['B'] = self.reg['A']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.MOV_AB:
-            self.reg['A'] = self.reg['B']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.MOV_CA:
-            self.reg['C'] = self.reg['A']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.MOV_AC:
-            self.reg['A'] = self.reg['C']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.MOV_DA:
-            self.reg['D'] = self.reg['A']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.MOV_AD:
-            self.reg['A'] = self.reg['D']
-            self.reg['PC'] += 1
-        elif opcode == Opcode.AND:
-            self.reg['A'] = self.reg['A'] & self.reg['B']
-            self.zero_flag = self.reg['A'] == 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.OR:
-            self.reg['A'] = self.reg['A'] | self.reg['B']
-            self.zero_flag = self.reg['A'] == 0
-            self.reg['PC'] += 1
-        elif opcode == Opcode.HALT:
-            self.running = False
+    def _op_inp(self, pc: int):
+        self.A = self.last_input if self.last_input != 0 else 0
+        self.last_input = 0
+        self.PC += 1
+
+    def _op_sub(self, pc: int):
+        result = self.A - self.B
+        self.carry_flag = result < 0
+        self.A = result & 0xFF
+        self.zero_flag = self.A == 0
+        self.PC += 1
+
+    def _op_ldc_imm(self, pc: int):
+        self.C = self.memory[pc + 1]
+        self.PC += 2
+
+    def _op_ldd_imm(self, pc: int):
+        self.D = self.memory[pc + 1]
+        self.PC += 2
+
+    def _op_inc(self, pc: int):
+        self.A = (self.A + 1) & 0xFF
+        self.zero_flag = self.A == 0
+        self.PC += 1
+
+    def _op_dec(self, pc: int):
+        self.A = (self.A - 1) & 0xFF
+        self.zero_flag = self.A == 0
+        self.PC += 1
+
+    def _op_jnz(self, pc: int):
+        if not self.zero_flag:
+            mem = self.memory
+            self.PC = mem[pc + 1] | (mem[pc + 2] << 8)
         else:
-            self.reg['PC'] += 1
-
-    def _read_address(self, addr: int) -> int:
-        """Read 16-bit address from memory (little-endian)"""
-        return self.memory[addr] | (self.memory[addr + 1] << 8)
-
-    def _push(self, value: int):
-        """Push 16-bit value onto stack"""
-        self.memory[self.reg['SP']] = value & 0xFF
-        self.reg['SP'] = (self.reg['SP'] - 1) & 0xFF
-        self.memory[self.reg['SP']] = (value >> 8) & 0xFF
-        self.reg['SP'] = (self.reg['SP'] - 1) & 0xFF
-
-    def _pop(self) -> int:
-        """Pop 16-bit value from stack"""
-        self.reg['SP'] = (self.reg['SP'] + 1) & 0xFF
-        high = self.memory[self.reg['SP']]
-        self.reg['SP'] = (self.reg['SP'] + 1) & 0xFF
-        low = self.memory[self.reg['SP']]
-        return (high << 8) | low
+            self.PC += 3
+
+    def _op_lda_abs(self, pc: int):
+        mem = self.memory
+        addr = mem[pc + 1] | (mem[pc + 2] << 8)
+        if addr < len(mem):
+            self.A = mem[addr]
+        self.PC += 3
+
+    def _op_lda_idx(self, pc: int):
+        addr = self.B + self.C
+        if addr < len(self.memory):
+            self.A = self.memory[addr]
+        self.PC += 1
+
+    def _op_sta_idx(self, pc: int):
+        addr = self.B + self.C
+        if addr < len(self.memory):
+            self.memory[addr] = self.A
+        self.PC += 1
+
+    def _op_call(self, pc: int):
+        # Push the return address (low byte first, stack grows down), then jump to the
+        # little-endian target
+        mem = self.memory
+        ret_addr = pc + 3
+        sp = self.SP
+        mem[sp] = ret_addr & 0xFF
+        sp = (sp - 1) & 0xFF
+        mem[sp] = (ret_addr >> 8) & 0xFF
+        self.SP = (sp - 1) & 0xFF
+        self.PC = mem[pc + 1] | (mem[pc + 2] << 8)
+
+    def _op_ret(self, pc: int):
+        # Pop the return address pushed by CALL
+        mem = self.memory
+        sp = (self.SP + 1) & 0xFF
+        high = mem[sp]
+        sp = (sp + 1) & 0xFF
+        self.SP = sp
+        self.PC = (high << 8) | mem[sp]
+
+    def _op_mov_ba(self, pc: int):
+        self.B = self.A
+        self.PC += 1
+
+    def _op_mov_ab(self, pc: int):
+        self.A = self.B
+        self.PC += 1
+
+    def _op_mov_ca(self, pc: int):
+        self.C = self.A
+        self.PC += 1
+
+    def _op_mov_ac(self, pc: int):
+        self.A = self.C
+        self.PC += 1
+
+    def _op_mov_da(self, pc: int):
+        self.D = self.A
+        self.PC += 1
+
+    def _op_mov_ad(self, pc: int):
+        self.A = self.D
+        self.PC += 1
+
+    def _op_and(self, pc: int):
+        self.A = self.A & self.B
+        self.zero_flag = self.A == 0
+        self.PC += 1
+
+    def _op_or(self, pc: int):
+        self.A = self.A | self.B
+        self.zero_flag = self.A == 0
+        self.PC += 1
+
+    def _op_halt(self, pc: int):
+        self.running = False
 
     def get_vram_pixel(self, x: int, y: int) -> int:
         """Get pixel value from VRAM"""
@@ -481,22 +772,15 @@ class GeminiCPU:
             return self.memory[addr]
         return 0
 
-    def set_vram_pixel(self, x: int, y: int, value: int):
-        """Set pixel value in VRAM"""
-        if 0 <= x < self.FB_WIDTH and 0 <= y < self.FB_HEIGHT:
-            addr = self.VRAM_START + (y * self.FB_WIDTH) + x
-            self.memory[addr] = value & 0xFF
-
     def clear_vram(self):
         """Clear all of VRAM"""
-        for i in range(self.VRAM_SIZE):
-            self.memory[self.VRAM_START + i] = 0
+        self.memory[self.VRAM_START:self.VRAM_START + self.VRAM_SIZE] = self._empty_vram
 
     def load_program(self, program: List[int], start_addr: int = 0):
         """Load a program into memory"""
         for i, val in enumerate(program):
             if start_addr + i < len(self.memory):
-                self.memory[start_addr + i] = val
+                self.memory[start_addr + i] = val & 0xFF
 
 
 class Game(ABC):
@@ -507,6 +791,8 @@ class Game(ABC):
         self.high_score_manager = high_score_manager
         self.width = cpu.FB_WIDTH
         self.height = cpu.FB_HEIGHT
+        # VRAM address of the first cell of each row
+        self.row_addr = tuple(cpu.VRAM_START + y * self.width for y in range(self.height))
         self.score = 0
         self.game_over = False
         self.game_speed = 0.15
@@ -545,10 +831,20 @@ class Game(ABC):
 class SnakeGame(Game):
     """Classic Snake game"""
 
+    # Arrow key -> (dx, dy) heading
+    DIRECTIONS = {
+        'UP': (0, -1),
+        'DOWN': (0, 1),
+        'LEFT': (-1, 0),
+        'RIGHT': (1, 0)
+    }
+
     def __init__(self, cpu: GeminiCPU, high_score_manager: HighScoreManager):
         super().__init__(cpu, high_score_manager)
         self.config = GameConfig()
-        self.snake: List[Tuple[int, int]] = []
+        self.snake: Deque[Tuple[int, int]] = deque()
+        self.snake_set: Set[Tuple[int, int]] = set()
+        self.cells = tuple((x, y) for y in range(self.height) for x in range(self.width))
         self.direction: Tuple[int, int] = (0, 0)
         self.food: Tuple[int, int] = (0, 0)
         self.game_speed = self.config.initial_speed
@@ -563,7 +859,9 @@ class SnakeGame(Game):
             self.save_high_score()
 
         self.load_high_score()
-        self.snake = [(self.width // 2, self.height // 2)]
+        start = (self.width // 2, self.height // 2)
+        self.snake = deque([start])
+        self.snake_set = {start}
         self.direction = (1, 0)
         self.food = self.place_food()
         self.score = 0
@@ -573,31 +871,31 @@ class SnakeGame(Game):
 
     def place_food(self) -> Tuple[int, int]:
         """Place food in random empty location"""
-        for _ in range(100):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            if (x, y) not in self.snake:
-                return (x, y)
+        snake_set = self.snake_set
+        free = [cell for cell in self.cells if cell not in snake_set]
+        if free:
+            return random.choice(free)
         return (0, 0)
 
     def update_display(self):
         """Update VRAM with current game state"""
-        vram_end = self.cpu.VRAM_START + self.cpu.VRAM_SIZE
-        for i in range(self.cpu.VRAM_START, vram_end):
-            self.cpu.memory[i] = DisplayChar.EMPTY
+        self.cpu.clear_vram()
+        mem = self.cpu.memory
+        row_addr = self.row_addr
+        w = self.width
+        h = self.height
 
         for i, (x, y) in enumerate(self.snake):
-            if 0 <= x < self.width and 0 <= y < self.height:
-                addr = self.cpu.VRAM_START + (y * self.width) + x
+            if 0 <= x < w and 0 <= y < h:
+                addr = row_addr[y] + x
                 if i == 0:
-                    self.cpu.memory[addr] = 3
+                    mem[addr] = 3
                 else:
-                    self.cpu.memory[addr] = 8
+                    mem[addr] = 8
 
         fx, fy = self.food
-        if 0 <= fx < self.width and 0 <= fy < self.height:
-            addr = self.cpu.VRAM_START + (fy * self.width) + fx
-            self.cpu.memory[addr] = 5
+        if 0 <= fx < w and 0 <= fy < h:
+            mem[row_addr[fy] + fx] = 5
 
         self.cpu.memory[self.cpu.SCORE_ADDR] = min(self.score, 255)
 
@@ -616,12 +914,13 @@ class SnakeGame(Game):
             self.save_high_score()
             return
 
-        if (new_x, new_y) in self.snake:
+        if (new_x, new_y) in self.snake_set:
             self.game_over = True
             self.save_high_score()
             return
 
-        self.snake.insert(0, (new_x, new_y))
+        self.snake.appendleft((new_x, new_y))
+        self.snake_set.add((new_x, new_y))
 
         if (new_x, new_y) == self.food:
             self.score += self.config.points_per_food
@@ -630,20 +929,14 @@ class SnakeGame(Game):
                 self.game_speed = max(self.config.min_speed,
                                      self.game_speed - self.config.speed_increment)
         else:
-            self.snake.pop()
+            self.snake_set.discard(self.snake.pop())
 
         self.update_display()
 
     def handle_input(self, key: str):
         """Handle input"""
-        direction_map = {
-            'UP': (0, -1),
-            'DOWN': (0, 1),
-            'LEFT': (-1, 0),
-            'RIGHT': (1, 0)
-        }
-        if key in direction_map:
-            new_dir = direction_map[key]
+        new_dir = self.DIRECTIONS.get(key)
+        if new_dir is not None:
             curr_dx, curr_dy = self.direction
             if new_dir != (-curr_dx, -curr_dy):
                 self.direction = new_dir
@@ -683,21 +976,18 @@ class PongGame(Game):
 
     def update_display(self):
         """Update VRAM"""
-        vram_end = self.cpu.VRAM_START + self.cpu.VRAM_SIZE
-        for i in range(self.cpu.VRAM_START, vram_end):
-            self.cpu.memory[i] = DisplayChar.EMPTY
+        self.cpu.clear_vram()
 
-        # Draw paddle (left side)
-        for i in range(self.paddle_height):
-            y = self.paddle_y + i
-            if 0 <= y < self.height:
-                addr = self.cpu.VRAM_START + y * self.width
-                self.cpu.memory[addr] = 6
+        # Draw paddle (left side) as one strided column store
+        top = max(0, self.paddle_y)
+        bottom = min(self.height, self.paddle_y + self.paddle_height)
+        if top < bottom:
+            col = self.cpu.VRAM_START
+            self.cpu.memory[col + top * self.width:col + bottom * self.width:self.width] = bytes([6]) * (bottom - top)
 
         # Draw ball
         if 0 <= self.ball_x < self.width and 0 <= self.ball_y < self.height:
-            addr = self.cpu.VRAM_START + self.ball_y * self.width + self.ball_x
-            self.cpu.memory[addr] = 7
+            self.cpu.memory[self.row_addr[self.ball_y] + self.ball_x] = 7
 
         self.cpu.memory[self.cpu.SCORE_ADDR] = min(self.score, 255)
 
@@ -735,10 +1025,13 @@ class PongGame(Game):
     def handle_input(self, key: str):
         """Handle input"""
         if key == 'UP':
-            self.paddle_y = max(0, self.paddle_y - 2)
-            self.update_display()
+            paddle_y = max(0, self.paddle_y - 2)
         elif key == 'DOWN':
-            self.paddle_y = min(self.height - self.paddle_height, self.paddle_y + 2)
+            paddle_y = min(self.height - self.paddle_height, self.paddle_y + 2)
+        else:
+            return
+        if paddle_y != self.paddle_y:
+            self.paddle_y = paddle_y
             self.update_display()
 
 
@@ -753,7 +1046,7 @@ class BreakoutGame(Game):
         self.ball_y = 0
         self.ball_dx = 0
         self.ball_dy = 0
-        self.bricks: List[Tuple[int, int]] = []
+        self.bricks: Set[Tuple[int, int]] = set()
         self.lives = 3
         self.game_speed = 0.1
         self.reset()
@@ -774,10 +1067,7 @@ class BreakoutGame(Game):
         self.ball_dy = -1
 
         # Create bricks
-        self.bricks = []
-        for y in range(2, 6):
-            for x in range(2, self.width - 2):
-                self.bricks.append((x, y))
+        self.bricks = {(x, y) for y in range(2, 6) for x in range(2, self.width - 2)}
 
         self.score = 0
         self.game_over = False
@@ -786,26 +1076,25 @@ class BreakoutGame(Game):
 
     def update_display(self):
         """Update VRAM"""
-        vram_end = self.cpu.VRAM_START + self.cpu.VRAM_SIZE
-        for i in range(self.cpu.VRAM_START, vram_end):
-            self.cpu.memory[i] = DisplayChar.EMPTY
+        self.cpu.clear_vram()
+
+        mem = self.cpu.memory
+        row_addr = self.row_addr
 
         # Draw bricks
         for x, y in self.bricks:
-            addr = self.cpu.VRAM_START + y * self.width + x
-            self.cpu.memory[addr] = 10
+            mem[row_addr[y] + x] = 10
 
-        # Draw paddle
-        for i in range(self.paddle_width):
-            x = self.paddle_x + i
-            if 0 <= x < self.width:
-                addr = self.cpu.VRAM_START + (self.height - 1) * self.width + x
-                self.cpu.memory[addr] = 6
+        # Draw paddle as one row slice
+        left = max(0, self.paddle_x)
+        right = min(self.width, self.paddle_x + self.paddle_width)
+        if left < right:
+            row = row_addr[self.height - 1]
+            mem[row + left:row + right] = bytes([6]) * (right - left)
 
         # Draw ball
         if 0 <= self.ball_x < self.width and 0 <= self.ball_y < self.height:
-            addr = self.cpu.VRAM_START + self.ball_y * self.width + self.ball_x
-            self.cpu.memory[addr] = 7
+            mem[row_addr[self.ball_y] + self.ball_x] = 7
 
         self.cpu.memory[self.cpu.SCORE_ADDR] = min(self.score, 255)
 
@@ -897,22 +1186,32 @@ class BreakoutGame(Game):
     def handle_input(self, key: str):
         """Handle input"""
         if key == 'LEFT':
-            self.paddle_x = max(0, self.paddle_x - 2)
-            self.update_display()
+            paddle_x = max(0, self.paddle_x - 2)
         elif key == 'RIGHT':
-            self.paddle_x = min(self.width - self.paddle_width, self.paddle_x + 2)
+            paddle_x = min(self.width - self.paddle_width, self.paddle_x + 2)
+        else:
+            return
+        if paddle_x != self.paddle_x:
+            self.paddle_x = paddle_x
             self.update_display()
 
 
 class RacingGame(Game):
     """Simple top-down racing game"""
 
+    RNG_BATCH = 1024
+
     def __init__(self, cpu: GeminiCPU, high_score_manager: HighScoreManager):
         super().__init__(cpu, high_score_manager)
         self.car_x = 0
-        self.obstacles: List[Tuple[int, int]] = []
+        # Obstacle positions as parallel x/y columns, oldest first
+        self.obs_x = bytearray()
+        self.obs_y = bytearray()
         self.scroll_offset = 0
         self.game_speed = 0.12
+        self.road = self.build_road()
+        self._rng_buf = b""
+        self._rng_i = 0
         self.reset()
 
     def get_name(self) -> str:
@@ -925,7 +1224,8 @@ class RacingGame(Game):
 
         self.load_high_score()
         self.car_x = self.width // 2
-        self.obstacles = []
+        self.obs_x = bytearray()
+        self.obs_y = bytearray()
         self.scroll_offset = 0
         self.score = 0
         self.game_over = False
@@ -933,34 +1233,43 @@ class RacingGame(Game):
 
     def spawn_obstacle(self):
         """Spawn a new obstacle"""
-        if random.random() < 0.3:
-            x = random.randint(2, self.width - 3)
-            self.obstacles.append((x, 0))
+        # One pre-generated random byte per tick decides the ~30% spawn chance; the
+        # lane between the road edges is only drawn on the rarer spawn path, with
+        # randrange so every lane is equally likely
+        i = self._rng_i
+        if i >= len(self._rng_buf):
+            self._rng_buf = random.randbytes(self.RNG_BATCH)
+            i = 0
+        self._rng_i = i + 1
+        if self._rng_buf[i] < 77:
+            self.obs_x.append(2 + random.randrange(self.width - 4))
+            self.obs_y.append(0)
+
+    def build_road(self) -> bytes:
+        """Build the static road frame (empty track between edge walls) for this board size"""
+        road = bytearray(self.cpu.VRAM_SIZE)
+        road[0::self.width] = bytes([4]) * self.height
+        road[self.width - 1::self.width] = bytes([4]) * self.height
+        return bytes(road)
 
     def update_display(self):
         """Update VRAM"""
-        vram_end = self.cpu.VRAM_START + self.cpu.VRAM_SIZE
-        for i in range(self.cpu.VRAM_START, vram_end):
-            self.cpu.memory[i] = DisplayChar.EMPTY
-
-        # Draw road edges
-        for y in range(self.height):
-            addr_left = self.cpu.VRAM_START + y * self.width
-            addr_right = self.cpu.VRAM_START + y * self.width + (self.width - 1)
-            self.cpu.memory[addr_left] = 4
-            self.cpu.memory[addr_right] = 4
+        # Clear VRAM and draw road edges in one copy of the precomputed road frame
+        mem = self.cpu.memory
+        vs = self.cpu.VRAM_START
+        row_addr = self.row_addr
+        w = self.width
+        h = self.height
+        mem[vs:vs + self.cpu.VRAM_SIZE] = self.road
 
         # Draw obstacles
-        for x, y in self.obstacles:
-            if 0 <= y < self.height and 0 <= x < self.width:
-                addr = self.cpu.VRAM_START + y * self.width + x
-                self.cpu.memory[addr] = 12
+        for x, y in zip(self.obs_x, self.obs_y):
+            if 0 <= y < h and 0 <= x < w:
+                mem[row_addr[y] + x] = 12
 
         # Draw car
-        car_y = self.height - 2
-        if 0 <= self.car_x < self.width:
-            addr = self.cpu.VRAM_START + car_y * self.width + self.car_x
-            self.cpu.memory[addr] = 11
+        if 0 <= self.car_x < w:
+            mem[row_addr[h - 2] + self.car_x] = 11
 
         self.cpu.memory[self.cpu.SCORE_ADDR] = min(self.score, 255)
 
@@ -969,21 +1278,31 @@ class RacingGame(Game):
         if self.game_over:
             return
 
-        # Move obstacles down
-        new_obstacles = []
-        for x, y in self.obstacles:
-            y += 1
-            if y < self.height:
-                new_obstacles.append((x, y))
-        self.obstacles = new_obstacles
+        # Move obstacles down, compacting out the ones that left the board in place
+        obs_x = self.obs_x
+        obs_y = self.obs_y
+        h = self.height
+        kept = 0
+        for i in range(len(obs_y)):
+            y = obs_y[i] + 1
+            if y < h:
+                obs_x[kept] = obs_x[i]
+                obs_y[kept] = y
+                kept += 1
+        del obs_x[kept:]
+        del obs_y[kept:]
 
         # Spawn new obstacles
         self.spawn_obstacle()
 
-        # Check collision
-        car_y = self.height - 2
-        for x, y in self.obstacles:
-            if x == self.car_x and y == car_y:
+        # Check collision. Obstacles spawn on the top row and all scroll together, so the
+        # arrays stay ordered bottom-first and the scan can stop above the car's row
+        car_y = h - 2
+        car_x = self.car_x
+        for x, y in zip(obs_x, obs_y):
+            if y < car_y:
+                break
+            if x == car_x and y == car_y:
                 self.game_over = True
                 self.save_high_score()
                 return
@@ -994,10 +1313,14 @@ class RacingGame(Game):
     def handle_input(self, key: str):
         """Handle input"""
         if key == 'LEFT':
-            self.car_x = max(1, self.car_x - 1)
-            self.update_display()
+            car_x = max(1, self.car_x - 1)
         elif key == 'RIGHT':
-            self.car_x = min(self.width - 2, self.car_x + 1)
+            car_x = min(self.width - 2, self.car_x + 1)
+        else:
+            return
+        # Autorepeat against the road edge leaves the car in place; skip the redraw
+        if car_x != self.car_x:
+            self.car_x = car_x
             self.update_display()
 
 
@@ -1024,10 +1347,38 @@ class PacManGame(Game):
         [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
     ]
 
+    # Arrow key -> (dx, dy) queued turn
+    DIRECTIONS = {
+        'UP': (0, -1),
+        'DOWN': (0, 1),
+        'LEFT': (-1, 0),
+        'RIGHT': (1, 0)
+    }
+
+    # Corners the blue ghost cycles between while patrolling
+    PATROL_CORNERS = ((1, 1), (14, 1), (1, 14), (14, 14))
+
+    # Maze cell type (empty, wall, dot, power pellet) -> display code
+    MAZE_TILES = bytes([0, 4, 2, 14]) + bytes(252)
+
+    # Flattened template and its dot + pellet count, fixed for every level
+    MAZE_CELLS = bytes(cell for row in MAZE_TEMPLATE for cell in row)
+    TOTAL_DOTS = MAZE_CELLS.count(2) + MAZE_CELLS.count(3)
+    BASE_VRAM = MAZE_CELLS.translate(MAZE_TILES)
+
     def __init__(self, cpu: GeminiCPU, high_score_manager: HighScoreManager):
         super().__init__(cpu, high_score_manager)
         self.game_speed = 0.12
-        self.maze: List[List[int]] = []
+        self.maze = bytearray(self.MAZE_CELLS)
+        self._base_vram = bytearray(self.BASE_VRAM)
+        # Walls never change, so the bitboard, exits and distance fields outlive resets.
+        # Wall bitboard: bit y * width + x is set for every wall cell
+        self.walls = 0
+        for i, cell in enumerate(self.MAZE_CELLS):
+            if cell == 1:
+                self.walls |= 1 << i
+        self.exits = self.build_exits()
+        self._fields: Dict[int, bytes] = {}
         self.player_x = 0
         self.player_y = 0
         self.player_dx = 0
@@ -1035,6 +1386,8 @@ class PacManGame(Game):
         self.next_dx = 0
         self.next_dy = 0
         self.ghosts: List['_Ghost'] = []
+        # Chase targeting per ghost slot: red, pink, blue, orange
+        self._ghost_targets = (self._target_red, self._target_pink, self._target_blue, self._target_orange)
         self.power_mode = 0
         self.lives = 3
         self.total_dots = 0
@@ -1049,9 +1402,10 @@ class PacManGame(Game):
             self.save_high_score()
 
         self.load_high_score()
-        # Copy maze template
-        self.maze = [row[:] for row in self.MAZE_TEMPLATE]
-        self.total_dots = sum(row.count(2) + row.count(3) for row in self.maze)
+        # Restore the maze and its walls/dots frame in place from the pristine copies
+        self.maze[:] = self.MAZE_CELLS
+        self._base_vram[:] = self.BASE_VRAM
+        self.total_dots = self.TOTAL_DOTS
         self.dots_remaining = self.total_dots
 
         # Player starts bottom-center in a valid corridor
@@ -1073,84 +1427,125 @@ class PacManGame(Game):
         self.game_over = False
         self.update_display()
 
+    def build_exits(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+        """Build the walkable neighbours of every cell (in _DIRS order) from the wall bitboard"""
+        w, h, walls = self.width, self.height, self.walls
+        return tuple(
+            tuple((x + dx, y + dy) for dx, dy in _DIRS
+                  if 0 <= x + dx < w and 0 <= y + dy < h and not (walls >> ((y + dy) * w + x + dx)) & 1)
+            for y in range(h) for x in range(w)
+        )
+
+    def dist_field(self, tx: int, ty: int) -> bytes:
+        """Get the BFS step distance from every cell to a target (0xFF = unreachable).
+
+        Fields are memoized per target cell for the life of the maze. Targets off the
+        board are clamped onto it, and a target inside a wall is replaced by the open
+        cells nearest to it.
+        """
+        w, h = self.width, self.height
+        tx = min(max(tx, 0), w - 1)
+        ty = min(max(ty, 0), h - 1)
+        target = ty * w + tx
+        field = self._fields.get(target)
+        if field is None:
+            field = self._fields[target] = self._bfs(tx, ty)
+        return field
+
+    def _bfs(self, tx: int, ty: int) -> bytes:
+        """Breadth-first flood from the target over the walkable exits"""
+        w, walls, exits = self.width, self.walls, self.exits
+        target = ty * w + tx
+        if (walls >> target) & 1:
+            open_cells = [i for i in range(len(exits)) if not (walls >> i) & 1]
+            best = min(abs(i % w - tx) + abs(i // w - ty) for i in open_cells)
+            seeds = [i for i in open_cells if abs(i % w - tx) + abs(i // w - ty) == best]
+        else:
+            seeds = [target]
+
+        dist = bytearray(b'\xff') * len(exits)
+        for i in seeds:
+            dist[i] = 0
+        queue = deque(seeds)
+        while queue:
+            i = queue.popleft()
+            step = dist[i] + 1
+            for x, y in exits[i]:
+                j = y * w + x
+                if dist[j] == 0xFF:
+                    dist[j] = step
+                    queue.append(j)
+        return bytes(dist)
+
     def handle_input(self, key: str):
-        if key == 'UP':
-            self.next_dx, self.next_dy = 0, -1
-        elif key == 'DOWN':
-            self.next_dx, self.next_dy = 0, 1
-        elif key == 'LEFT':
-            self.next_dx, self.next_dy = -1, 0
-        elif key == 'RIGHT':
-            self.next_dx, self.next_dy = 1, 0
+        turn = self.DIRECTIONS.get(key)
+        if turn is not None:
+            self.next_dx, self.next_dy = turn
 
     def update(self):
         if self.game_over:
             return
 
+        # Bind the per-tick state to locals; player position is written back when it moves
+        w, h, walls = self.width, self.height, self.walls
+        px, py = self.player_x, self.player_y
+        ghosts = self.ghosts
+
         # Try to change direction
-        nx = self.player_x + self.next_dx
-        ny = self.player_y + self.next_dy
-        if 0 <= nx < self.width and 0 <= ny < self.height and self.maze[ny][nx] != 1:
-            self.player_dx, self.player_dy = self.next_dx, self.next_dy
+        ndx, ndy = self.next_dx, self.next_dy
+        nx = px + ndx
+        ny = py + ndy
+        if 0 <= nx < w and 0 <= ny < h and not (walls >> (ny * w + nx)) & 1:
+            self.player_dx, self.player_dy = ndx, ndy
 
         # Move player
-        nx = self.player_x + self.player_dx
-        ny = self.player_y + self.player_dy
-        if 0 <= nx < self.width and 0 <= ny < self.height and self.maze[ny][nx] != 1:
-            self.player_x, self.player_y = nx, ny
+        nx = px + self.player_dx
+        ny = py + self.player_dy
+        if 0 <= nx < w and 0 <= ny < h and not (walls >> (ny * w + nx)) & 1:
+            px, py = nx, ny
+            self.player_x, self.player_y = px, py
 
         # Eat dots
-        cell = self.maze[self.player_y][self.player_x]
+        pos = py * w + px
+        maze = self.maze
+        cell = maze[pos]
         if cell == 2:  # regular dot
-            self.maze[self.player_y][self.player_x] = 0
+            maze[pos] = 0
+            self._base_vram[pos] = DisplayChar.EMPTY
             self.score += 10
             self.dots_remaining -= 1
         elif cell == 3:  # power pellet
-            self.maze[self.player_y][self.player_x] = 0
+            maze[pos] = 0
+            self._base_vram[pos] = DisplayChar.EMPTY
             self.score += 50
             self.dots_remaining -= 1
             self.power_mode = 80  # ~8 seconds at 0.12 speed
-            for g in self.ghosts:
+            for g in ghosts:
                 g.scared = True
 
         # Power mode countdown
         if self.power_mode > 0:
             self.power_mode -= 1
             if self.power_mode == 0:
-                for g in self.ghosts:
+                for g in ghosts:
                     g.scared = False
 
-        # Move ghosts - each has different AI behavior
-        for i, g in enumerate(self.ghosts):
+        # Move ghosts - each has different AI behavior, routed along maze shortest paths
+        exits = self.exits
+        dist_field = self.dist_field
+        for g, target in zip(ghosts, self._ghost_targets):
             if not g.eaten:
                 if g.scared:
                     # All scared ghosts run to opposite corner
-                    tx = 0 if self.player_x > 8 else 15
-                    ty = 0 if self.player_y > 8 else 15
-                    g.move_toward(tx, ty, self.maze, self.width, self.height)
+                    tx = 0 if px > 8 else 15
+                    ty = 0 if py > 8 else 15
                 else:
-                    # Each ghost has unique behavior
-                    if i == 0:  # Red: direct chase
-                        g.move_toward(self.player_x, self.player_y, self.maze, self.width, self.height)
-                    elif i == 1:  # Pink: ambush ahead of player
-                        target_x = self.player_x + self.player_dx * 4
-                        target_y = self.player_y + self.player_dy * 4
-                        g.move_toward(target_x, target_y, self.maze, self.width, self.height)
-                    elif i == 2:  # Blue: patrol corners
-                        corners = [(1,1), (14,1), (1,14), (14,14)]
-                        target = corners[(g.x + g.y) % 4]
-                        g.move_toward(target[0], target[1], self.maze, self.width, self.height)
-                    else:  # Orange: scatter / semi-random
-                        if abs(self.player_x - g.x) + abs(self.player_y - g.y) < 8:
-                            # Close to player: run to corner
-                            g.move_toward(1, 1, self.maze, self.width, self.height)
-                        else:
-                            # Far from player: chase
-                            g.move_toward(self.player_x, self.player_y, self.maze, self.width, self.height)
-
-        # Check ghost collisions
-        for g in self.ghosts:
-            if g.x == self.player_x and g.y == self.player_y:
+                    tx, ty = target(g, px, py)
+                g.move_toward(dist_field(tx, ty), exits, w)
+
+        # Check ghost collisions and tick respawn timers in one pass
+        for g in ghosts:
+            if g.x == px and g.y == py:
                 if g.scared and not g.eaten:
                     # Eat ghost
                     self.score += 200
@@ -1164,13 +1559,12 @@ class PacManGame(Game):
                         self.save_high_score()
                     else:
                         # Reset positions
-                        self.player_x, self.player_y = 9, 13
+                        px, py = 9, 13
+                        self.player_x, self.player_y = px, py
                         self.player_dx, self.player_dy = 0, 0
-                        for gh in self.ghosts:
+                        for gh in ghosts:
                             gh.reset_pos()
 
-        # Ghost respawn
-        for g in self.ghosts:
             if g.eaten:
                 g.respawn_timer -= 1
                 if g.respawn_timer <= 0:
@@ -1185,80 +1579,115 @@ class PacManGame(Game):
 
         self.update_display()
 
+    def _target_red(self, g: '_Ghost', px: int, py: int) -> Tuple[int, int]:
+        """Red: direct chase"""
+        return px, py
+
+    def _target_pink(self, g: '_Ghost', px: int, py: int) -> Tuple[int, int]:
+        """Pink: ambush ahead of player"""
+        return px + self.player_dx * 4, py + self.player_dy * 4
+
+    def _target_blue(self, g: '_Ghost', px: int, py: int) -> Tuple[int, int]:
+        """Blue: patrol corners"""
+        return self.PATROL_CORNERS[(g.x + g.y) % 4]
+
+    def _target_orange(self, g: '_Ghost', px: int, py: int) -> Tuple[int, int]:
+        """Orange: run to a corner when close to the player, chase when far"""
+        if abs(px - g.x) + abs(py - g.y) < 8:
+            return 1, 1
+        return px, py
+
     def update_display(self):
-        vram_end = self.cpu.VRAM_START + self.cpu.VRAM_SIZE
-        for i in range(self.cpu.VRAM_START, vram_end):
-            self.cpu.memory[i] = DisplayChar.EMPTY
-
-        # Draw maze
-        for y in range(self.height):
-            for x in range(self.width):
-                addr = self.cpu.VRAM_START + y * self.width + x
-                cell = self.maze[y][x]
-                if cell == 1:
-                    self.cpu.memory[addr] = 4
-                elif cell == 2:
-                    self.cpu.memory[addr] = 2
-                elif cell == 3:
-                    self.cpu.memory[addr] = 14
+        # Draw maze from the cached walls/dots frame
+        mem = self.cpu.memory
+        vs = self.cpu.VRAM_START
+        row_addr = self.row_addr
+        mem[vs:vs + self.cpu.VRAM_SIZE] = self._base_vram
 
         # Draw ghosts
         for g in self.ghosts:
             if not g.eaten:
-                addr = self.cpu.VRAM_START + g.y * self.width + g.x
+                addr = row_addr[g.y] + g.x
                 if g.scared:
-                    self.cpu.memory[addr] = 1
+                    mem[addr] = 1
                 else:
-                    self.cpu.memory[addr] = 12
+                    mem[addr] = 12
 
         # Draw player
-        addr = self.cpu.VRAM_START + self.player_y * self.width + self.player_x
-        self.cpu.memory[addr] = 15
+        mem[row_addr[self.player_y] + self.player_x] = 15
 
         self.cpu.memory[self.cpu.SCORE_ADDR] = min(self.score, 255)
 
 
+# Ghost move order: up, down, left, right (ties go to the earliest)
+_DIRS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
 class _Ghost:
     """Ghost AI for Pac-Man"""
-    __slots__ = ('x', 'y', 'start_x', 'start_y', 'color', 'scared', 'eaten', 'respawn_timer')
+    # Per-tick fields first, spawn data last
+    __slots__ = ('x', 'y', 'scared', 'eaten', 'respawn_timer', 'start_x', 'start_y', 'color')
 
     def __init__(self, x: int, y: int, color: str):
         self.x = x
         self.y = y
-        self.start_x = x
-        self.start_y = y
-        self.color = color
         self.scared = False
         self.eaten = False
         self.respawn_timer = 0
+        self.start_x = x
+        self.start_y = y
+        self.color = color
 
     def reset_pos(self):
         self.x = self.start_x
         self.y = self.start_y
 
-    def move_toward(self, target_x: int, target_y: int, maze: list, width: int, height: int):
-        """Simple AI: pick direction that gets closer to target"""
-        dirs = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+    def move_toward(self, field: bytes, exits: tuple, width: int):
+        """Step to the exit with the shortest remaining path in a PacManGame.dist_field"""
         best_pos = None
-        best_dist = 9999
-
-        for dx, dy in dirs:
-            nx, ny = self.x + dx, self.y + dy
-            if 0 <= nx < width and 0 <= ny < height and maze[ny][nx] != 1:
-                dist = abs(nx - target_x) + abs(ny - target_y)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_pos = (nx, ny)
-
-        if best_pos:
+        best_dist = 0x100
+
+        for pos in exits[self.y * width + self.x]:
+            dist = field[pos[1] * width + pos[0]]
+            if dist < best_dist:
+                best_dist = dist
+                best_pos = pos
+                # An exit onto the target itself can't be beaten
+                if not dist:
+                    break
+
+        if best_pos is not None:
             self.x, self.y = best_pos
 
 
 class InputHandler:
     """Platform-independent input handler"""
 
+    WINDOWS_KEYS = {b'H': 'UP', b'P': 'DOWN', b'K': 'LEFT', b'M': 'RIGHT'}
+    ANSI_KEYS = {'A': 'UP', 'B': 'DOWN', 'C': 'RIGHT', 'D': 'LEFT'}
+    ESCAPE_TIMEOUT = 0.05  # seconds to wait for the rest of a split escape sequence
+    # A complete CSI (ESC [ params intermediates final) or SS3 (ESC O char) key sequence,
+    # and any proper prefix of one
+    ESCAPE_SEQ = re.compile(r'\x1b(?:\[[0-?]*[ -/]*[@-~]|O.)', re.S)
+    ESCAPE_PREFIX = re.compile(r'\x1b(?:\[[0-?]*[ -/]*|O)?')
+
     def __init__(self):
         self.old_settings = None
+        # Resolve the platform polling module once instead of on every poll
+        self._msvcrt = None
+        self._select = None
+        if os.name == 'nt':
+            try:
+                import msvcrt
+                self._msvcrt = msvcrt
+            except ImportError:
+                pass
+        else:
+            import select
+            self._select = select.select
+        # Unix keys are read from the fd in bulk; decoded text not yet handed out waits here
+        self._pending = ''
+        self._decoder = codecs.getincrementaldecoder(getattr(sys.stdin, 'encoding', None) or 'utf-8')(errors='ignore')
 
     def __enter__(self):
         """Setup terminal for raw input"""
@@ -1278,6 +1707,20 @@ class InputHandler:
             import termios
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
 
+    def wait(self, timeout: Optional[float] = None):
+        """Block until input is ready or timeout seconds pass (None waits indefinitely)"""
+        if self._pending:
+            return
+        poll = 0.01 if timeout is None else min(timeout, 0.01)
+        if self._select is None:
+            # No select() on Windows console handles; fall back to a short poll
+            time.sleep(poll)
+            return
+        try:
+            self._select([sys.stdin], [], [], timeout)
+        except (OSError, ValueError):
+            time.sleep(poll)
+
     def get_input(self) -> Optional[str]:
         """Get non-blocking input"""
         if os.name == 'nt':
@@ -1287,98 +1730,146 @@ class InputHandler:
 
     def _get_windows_input(self) -> Optional[str]:
         """Get input on Windows"""
-        try:
-            import msvcrt
-            if msvcrt.kbhit():
+        msvcrt = self._msvcrt
+        if msvcrt is not None and msvcrt.kbhit():
+            char = msvcrt.getch()
+            if char == b'\xe0':
                 char = msvcrt.getch()
-                if char == b'\xe0':
-                    char = msvcrt.getch()
-                    key_map = {b'H': 'UP', b'P': 'DOWN', 
-                              b'K': 'LEFT', b'M': 'RIGHT'}
-                    return key_map.get(char)
-                else:
-                    return char.decode('utf-8', errors='ignore').lower()
-        except ImportError:
-            pass
+                return self.WINDOWS_KEYS.get(char)
+            else:
+                return char.decode('utf-8', errors='ignore').lower()
         return None
 
+    def _read_unix(self, timeout: float = 0.0) -> bool:
+        """Move whatever is waiting on stdin into the pending buffer with one read"""
+        fd = sys.stdin.fileno()
+        if not self._select([fd], [], [], timeout)[0]:
+            return False
+        self._pending += self._decoder.decode(os.read(fd, 64))
+        return True
+
     def _get_unix_input(self) -> Optional[str]:
         """Get input on Unix-like systems"""
         try:
-            import select
-            if select.select([sys.stdin], [], [], 0.0)[0]:
-                char = sys.stdin.read(1)
-
-                if char == '\x1b':
-                    next1 = sys.stdin.read(1)
-                    if next1 == '[':
-                        next2 = sys.stdin.read(1)
-                        key_map = {'A': 'UP', 'B': 'DOWN',
-                                  'C': 'RIGHT', 'D': 'LEFT'}
-                        return key_map.get(next2)
-                elif char == '\x03':
-                    return 'q'
-                else:
-                    return char.lower()
+            if not self._pending and not self._read_unix():
+                return None
+            pending = self._pending
+            char = pending[0]
+
+            if char == '\x1b':
+                # A key sequence normally arrives in one write; if it was split, give
+                # the rest a moment to arrive
+                while self.ESCAPE_PREFIX.fullmatch(pending) and self._read_unix(self.ESCAPE_TIMEOUT):
+                    pending = self._pending
+                match = self.ESCAPE_SEQ.match(pending)
+                if match:
+                    # Swallow the whole sequence; only arrows (final byte A-D) are keys
+                    self._pending = pending[match.end():]
+                    return self.ANSI_KEYS.get(match.group()[-1])
+                # A truncated sequence is dropped whole; ESC plus any other char as a pair
+                self._pending = '' if self.ESCAPE_PREFIX.fullmatch(pending) else pending[2:]
+                return None
+            self._pending = pending[1:]
+            if char == '\x03':
+                return 'q'
+            return char.lower()
         except Exception:
-            pass
+            self._pending = ''
         return None
 
 
+# Pre-formatted hex and ASCII cells for each byte value in memory dumps
+_DUMP_HEX = tuple(f"{Style.BRIGHT_CYAN}{b:02X}{Style.RESET} " for b in range(256))
+_DUMP_ASCII = tuple(chr(b) if 32 <= b < 127 else f"{Style.DIM}.{Style.RESET}" for b in range(256))
+
+
+# Shell banner and help text, formatted once at import
+_SHELL_BANNER = "\n".join([
+    "\033[2J\033[H",
+    "",
+    f"  {Style.BRIGHT_CYAN}╔{'═' * 60}╗{Style.RESET}",
+    f"  {Style.BRIGHT_CYAN}║{Style.RESET}  {Style.BRIGHT_WHITE}{Style.BOLD}GEMINI-1 MICROCOMPUTER - INTERACTIVE SHELL{Style.RESET}              {Style.BRIGHT_CYAN}║{Style.RESET}",
+    f"  {Style.BRIGHT_CYAN}║{Style.RESET}  {Style.DIM}8-bit CPU | 64KB RAM | 16x16 VRAM{Style.RESET}                      {Style.BRIGHT_CYAN}║{Style.RESET}",
+    f"  {Style.BRIGHT_CYAN}╠{'═' * 60}╣{Style.RESET}",
+    f"  {Style.BRIGHT_CYAN}║{Style.RESET}  {Style.BRIGHT_YELLOW}Type 'HELP' for available commands{Style.RESET}                    {Style.BRIGHT_CYAN}║{Style.RESET}",
+    f"  {Style.BRIGHT_CYAN}╚{'═' * 60}╝{Style.RESET}",
+    "",
+])
+
+_SHELL_COMMANDS = (
+    ("HELP", "Show this help message"),
+    ("STATUS", "Display CPU status and registers"),
+    ("MEM <addr>", "Read memory at address (hex or dec)"),
+    ("PEEK <addr>", "Peek at memory address (alias for MEM)"),
+    ("POKE <addr> <val>", "Write value to memory address"),
+    ("REGS", "Display all CPU registers"),
+    ("VRAM", "Display video RAM contents"),
+    ("RESET", "Reset CPU to initial state"),
+    ("RUN [addr]", "Execute program from address"),
+    ("STEP [n]", "Execute n instructions (default 1)"),
+    ("DUMP <start> <end>", "Dump memory range"),
+    ("FILL <start> <end> <val>", "Fill memory range with value"),
+    ("CLEAR", "Clear the screen"),
+    ("HISTORY", "Show command history"),
+    ("DEMO", "Run a demo pattern on VRAM"),
+    ("INFO", "Display system information"),
+    ("VER", "Display version information"),
+    ("EXIT", "Exit the shell"),
+)
+
+_SHELL_HELP = "\n".join([
+    f"\n  {Style.BRIGHT_WHITE}{Style.BOLD}Available Commands:{Style.RESET}\n",
+    *(f"    {Style.BRIGHT_CYAN}{cmd:22s}{Style.RESET} {Style.DIM}{desc}{Style.RESET}" for cmd, desc in _SHELL_COMMANDS),
+    "",
+])
+
+
 class GEMINIShell:
     """Enhanced Command Line Interface for GEMINI-1"""
     def __init__(self, cpu: GeminiCPU):
         self.cpu = cpu
         self.running = True
         self.history = []
+        self._commands = self._build_commands()
+
+    def _build_commands(self) -> dict:
+        """Build the command-word -> handler table used by run()"""
+        return {
+            'EXIT': self._cmd_exit,
+            'QUIT': self._cmd_exit,
+            'HELP': self._cmd_help,
+            'STATUS': self._cmd_status,
+            'REGS': self._cmd_regs,
+            'MEM': self._cmd_mem,
+            'PEEK': self._cmd_mem,
+            'POKE': self._cmd_poke,
+            'DUMP': self._cmd_dump,
+            'FILL': self._cmd_fill,
+            'VRAM': self._cmd_vram,
+            'RESET': self._cmd_reset,
+            'RUN': self._cmd_run,
+            'STEP': self._cmd_step,
+            'DEMO': self._cmd_demo,
+            'INFO': self._cmd_info,
+            'HISTORY': self._cmd_history,
+            'CLEAR': self._cmd_clear,
+            'VER': self._cmd_ver,
+        }
 
     def print_banner(self):
         """Print enhanced shell banner"""
-        print("\033[2J\033[H")
-        print()
-        print(f"  {Style.BRIGHT_CYAN}╔{'═' * 60}╗{Style.RESET}")
-        print(f"  {Style.BRIGHT_CYAN}║{Style.RESET}  {Style.BRIGHT_WHITE}{Style.BOLD}GEMINI-1 MICROCOMPUTER - INTERACTIVE SHELL{Style.RESET}              {Style.BRIGHT_CYAN}║{Style.RESET}")
-        print(f"  {Style.BRIGHT_CYAN}║{Style.RESET}  {Style.DIM}8-bit CPU | 64KB RAM | 16x16 VRAM{Style.RESET}                      {Style.BRIGHT_CYAN}║{Style.RESET}")
-        print(f"  {Style.BRIGHT_CYAN}╠{'═' * 60}╣{Style.RESET}")
-        print(f"  {Style.BRIGHT_CYAN}║{Style.RESET}  {Style.BRIGHT_YELLOW}Type 'HELP' for available commands{Style.RESET}                    {Style.BRIGHT_CYAN}║{Style.RESET}")
-        print(f"  {Style.BRIGHT_CYAN}╚{'═' * 60}╝{Style.RESET}")
-        print()
+        print(_SHELL_BANNER)
 
     def print_help(self):
         """Print enhanced help message"""
-        commands = [
-            ("HELP", "Show this help message"),
-            ("STATUS", "Display CPU status and registers"),
-            ("MEM <addr>", "Read memory at address (hex or dec)"),
-            ("PEEK <addr>", "Peek at memory address (alias for MEM)"),
-            ("POKE <addr> <val>", "Write value to memory address"),
-            ("REGS", "Display all CPU registers"),
-            ("VRAM", "Display video RAM contents"),
-            ("RESET", "Reset CPU to initial state"),
-            ("RUN [addr]", "Execute program from address"),
-            ("STEP [n]", "Execute n instructions (default 1)"),
-            ("DUMP <start> <end>", "Dump memory range"),
-            ("FILL <start> <end> <val>", "Fill memory range with value"),
-            ("CLEAR", "Clear the screen"),
-            ("HISTORY", "Show command history"),
-            ("DEMO", "Run a demo pattern on VRAM"),
-            ("INFO", "Display system information"),
-            ("VER", "Display version information"),
-            ("EXIT", "Exit the shell"),
-        ]
-        
-        print(f"\n  {Style.BRIGHT_WHITE}{Style.BOLD}Available Commands:{Style.RESET}\n")
-        for cmd, desc in commands:
-            cmd_colored = f"{Style.BRIGHT_CYAN}{cmd:22s}{Style.RESET}"
-            print(f"    {cmd_colored} {Style.DIM}{desc}{Style.RESET}")
-        print()
+        print(_SHELL_HELP)
 
     def print_status(self):
         """Print CPU status"""
         print(f"\n  {Style.BRIGHT_WHITE}{Style.BOLD}CPU Status:{Style.RESET}")
         print(f"  {Style.BRIGHT_CYAN}├─{Style.RESET} Running: {Style.BRIGHT_GREEN if self.cpu.running else Style.BRIGHT_RED}{self.cpu.running}{Style.RESET}")
-        print(f"  {Style.BRIGHT_CYAN}├─{Style.RESET} PC: {Style.BRIGHT_YELLOW}0x{self.cpu.reg['PC']:02X}{Style.RESET} ({self.cpu.reg['PC']})")
-        print(f"  {Style.BRIGHT_CYAN}├─{Style.RESET} SP: {Style.BRIGHT_YELLOW}0x{self.cpu.reg['SP']:02X}{Style.RESET} ({self.cpu.reg['SP']})")
+        print(f"  {Style.BRIGHT_CYAN}├─{Style.RESET} PC: {Style.BRIGHT_YELLOW}0x{self.cpu.PC:02X}{Style.RESET} ({self.cpu.PC})")
+        print(f"  {Style.BRIGHT_CYAN}├─{Style.RESET} SP: {Style.BRIGHT_YELLOW}0x{self.cpu.SP:02X}{Style.RESET} ({self.cpu.SP})")
         print(f"  {Style.BRIGHT_CYAN}├─{Style.RESET} Zero Flag: {Style.BRIGHT_GREEN if self.cpu.zero_flag else Style.DIM}{self.cpu.zero_flag}{Style.RESET}")
         print(f"  {Style.BRIGHT_CYAN}└─{Style.RESET} Carry Flag: {Style.BRIGHT_GREEN if self.cpu.carry_flag else Style.DIM}{self.cpu.carry_flag}{Style.RESET}")
         print()
@@ -1387,12 +1878,12 @@ class GEMINIShell:
         """Print all registers"""
         print(f"\n  {Style.BRIGHT_WHITE}{Style.BOLD}CPU Registers:{Style.RESET}")
         for reg_name in ['A', 'B', 'C', 'D']:
-            val = self.cpu.reg[reg_name]
+            val = getattr(self.cpu, reg_name)
             binary = format(val, '08b')
             print(f"  {Style.BRIGHT_CYAN}{reg_name:3s}{Style.RESET} = {Style.BRIGHT_YELLOW}0x{val:02X}{Style.RESET} ({val:3d}) [{Style.DIM}{binary}{Style.RESET}]")
         
-        pc_val = self.cpu.reg['PC']
-        sp_val = self.cpu.reg['SP']
+        pc_val = self.cpu.PC
+        sp_val = self.cpu.SP
         print(f"  {Style.BRIGHT_CYAN}PC {Style.RESET} = {Style.BRIGHT_YELLOW}0x{pc_val:02X}{Style.RESET} ({pc_val:3d})")
         print(f"  {Style.BRIGHT_CYAN}SP {Style.RESET} = {Style.BRIGHT_YELLOW}0x{sp_val:02X}{Style.RESET} ({sp_val:3d})")
         print(f"  {Style.BRIGHT_CYAN}ZF {Style.RESET} = {Style.BRIGHT_GREEN if self.cpu.zero_flag else Style.BRIGHT_RED}{self.cpu.zero_flag}{Style.RESET}")
@@ -1419,23 +1910,19 @@ class GEMINIShell:
         """Dump memory range"""
         print(f"\n  {Style.BRIGHT_WHITE}Memory Dump [{Style.BRIGHT_YELLOW}0x{start:04X}{Style.RESET} - {Style.BRIGHT_YELLOW}0x{end:04X}{Style.RESET}]:{Style.RESET}\n")
         
-        for addr in range(start, min(end + 1, len(self.cpu.memory)), 16):
-            hex_str = f"{Style.BRIGHT_YELLOW}0x{addr:04X}{Style.RESET}  "
-            ascii_str = ""
-            
-            for i in range(16):
-                if addr + i <= end and addr + i < len(self.cpu.memory):
-                    byte = self.cpu.memory[addr + i]
-                    hex_str += f"{Style.BRIGHT_CYAN}{byte:02X}{Style.RESET} "
-                    ascii_str += chr(byte) if 32 <= byte < 127 else f"{Style.DIM}.{Style.RESET}"
-                else:
-                    hex_str += "   "
-                    ascii_str += " "
-                
-                if i == 7:
-                    hex_str += " "
-            
-            print(f"  {hex_str} {Style.DIM}|{Style.RESET} {ascii_str}")
+        memory = self.cpu.memory
+        stop = min(end + 1, len(memory))
+        lines = []
+        for addr in range(start, stop, 16):
+            chunk = memory[addr:min(addr + 16, stop)]
+            pad = 16 - len(chunk)
+            cells = [*map(_DUMP_HEX.__getitem__, chunk), *("   ",) * pad]
+            hex_str = f"{Style.BRIGHT_YELLOW}0x{addr:04X}{Style.RESET}  {''.join(cells[:8])} {''.join(cells[8:])}"
+            ascii_str = ''.join(map(_DUMP_ASCII.__getitem__, chunk)) + " " * pad
+            lines.append(f"  {hex_str} {Style.DIM}|{Style.RESET} {ascii_str}")
+
+        if lines:
+            print('\n'.join(lines))
         print()
 
     def display_vram(self):
@@ -1458,13 +1945,20 @@ class GEMINIShell:
     def run_demo(self):
         """Run a demo pattern on VRAM"""
         print(f"  {Style.BRIGHT_GREEN}Running demo pattern...{Style.RESET}\n")
+        self.cpu.invalidate_display()
         
+        width = self.cpu.FB_WIDTH
+        height = self.cpu.FB_HEIGHT
+        vs = self.cpu.VRAM_START
+        frame = bytearray(self.cpu.VRAM_SIZE)
         for i in range(10):
-            self.cpu.clear_vram()
-            for y in range(self.cpu.FB_HEIGHT):
-                for x in range(self.cpu.FB_WIDTH):
-                    val = ((x + i) * (y + i)) % 16
-                    self.cpu.set_vram_pixel(x, y, val)
+            # Every cell is overwritten, so the frame needs no clearing
+            cols = range(i, width + i)
+            for y in range(height):
+                base = y * width
+                yi = y + i
+                frame[base:base + width] = bytes([(col * yi) & 15 for col in cols])
+            self.cpu.memory[vs:vs + self.cpu.VRAM_SIZE] = frame
             
             self.cpu.render(title="DEMO MODE", paused=False)
             time.sleep(0.2)
@@ -1514,128 +2008,9 @@ class GEMINIShell:
                 cmd = parts[0]
                 args = parts[1:]
                 
-                if cmd == 'EXIT' or cmd == 'QUIT':
-                    self.running = False
-                    print(f"\n  {Style.BRIGHT_CYAN}Exiting shell...{Style.RESET}\n")
-                
-                elif cmd == 'HELP':
-                    self.print_help()
-                
-                elif cmd == 'STATUS':
-                    self.print_status()
-                
-                elif cmd == 'REGS':
-                    self.print_registers()
-                
-                elif cmd in ['MEM', 'PEEK']:
-                    if not args:
-                        print(f"  {Style.BRIGHT_RED}Usage: {cmd} <address>{Style.RESET}")
-                    else:
-                        addr = self.parse_number(args[0])
-                        if addr is not None:
-                            self.read_memory(addr)
-                        else:
-                            print(f"  {Style.BRIGHT_RED}ERROR: Invalid address{Style.RESET}")
-                
-                elif cmd == 'POKE':
-                    if len(args) < 2:
-                        print(f"  {Style.BRIGHT_RED}Usage: POKE <address> <value>{Style.RESET}")
-                    else:
-                        addr = self.parse_number(args[0])
-                        val = self.parse_number(args[1])
-                        if addr is not None and val is not None:
-                            self.write_memory(addr, val)
-                        else:
-                            print(f"  {Style.BRIGHT_RED}ERROR: Invalid address or value{Style.RESET}")
-                
-                elif cmd == 'DUMP':
-                    if len(args) < 2:
-                        print(f"  {Style.BRIGHT_RED}Usage: DUMP <start> <end>{Style.RESET}")
-                    else:
-                        start = self.parse_number(args[0])
-                        end = self.parse_number(args[1])
-                        if start is not None and end is not None:
-                            self.dump_memory(start, end)
-                        else:
-                            print(f"  {Style.BRIGHT_RED}ERROR: Invalid addresses{Style.RESET}")
-                
-                elif cmd == 'FILL':
-                    if len(args) < 3:
-                        print(f"  {Style.BRIGHT_RED}Usage: FILL <start> <end> <value>{Style.RESET}")
-                    else:
-                        start = self.parse_number(args[0])
-                        end = self.parse_number(args[1])
-                        val = self.parse_number(args[2])
-                        if start is not None and end is not None and val is not None:
-                            for addr in range(start, min(end + 1, len(self.cpu.memory))):
-                                self.cpu.memory[addr] = val & 0xFF
-                            print(f"  {Style.BRIGHT_GREEN}✓{Style.RESET} Filled memory range with {Style.BRIGHT_YELLOW}0x{val:02X}{Style.RESET}")
-                        else:
-                            print(f"  {Style.BRIGHT_RED}ERROR: Invalid parameters{Style.RESET}")
-                
-                elif cmd == 'VRAM':
-                    self.display_vram()
-                
-                elif cmd == 'RESET':
-                    self.cpu.reg = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'PC': 0, 'SP': self.cpu.STACK_TOP}
-                    self.cpu.zero_flag = False
-                    self.cpu.carry_flag = False
-                    self.cpu.running = True
-                    print(f"  {Style.BRIGHT_GREEN}✓ CPU reset{Style.RESET}")
-                
-                elif cmd == 'RUN':
-                    start_addr = 0
-                    if args:
-                        addr = self.parse_number(args[0])
-                        if addr is not None:
-                            start_addr = addr
-                    
-                    self.cpu.reg['PC'] = start_addr
-                    self.cpu.running = True
-                    print(f"  {Style.BRIGHT_GREEN}Running from address 0x{start_addr:04X}...{Style.RESET}")
-                    
-                    steps = 0
-                    while self.cpu.running and steps < 1000:
-                        self.cpu.step()
-                        steps += 1
-                    
-                    print(f"  {Style.BRIGHT_GREEN}✓ Executed {steps} instructions{Style.RESET}")
-                
-                elif cmd == 'STEP':
-                    n = 1
-                    if args:
-                        n_val = self.parse_number(args[0])
-                        if n_val is not None:
-                            n = n_val
-                    
-                    for _ in range(n):
-                        if self.cpu.running:
-                            self.cpu.step()
-                    
-                    print(f"  {Style.BRIGHT_GREEN}✓ Stepped {n} instruction(s){Style.RESET}")
-                    self.print_status()
-                
-                elif cmd == 'DEMO':
-                    self.run_demo()
-                
-                elif cmd == 'INFO':
-                    self.show_info()
-                
-                elif cmd == 'HISTORY':
-                    print(f"\n  {Style.BRIGHT_WHITE}Command History:{Style.RESET}\n")
-                    for i, h in enumerate(self.history[-20:], 1):
-                        print(f"  {Style.DIM}{i:3d}.{Style.RESET} {h}")
-                    print()
-                
-                elif cmd == 'CLEAR':
-                    print("\033[2J\033[H")
-                    self.print_banner()
-                
-                elif cmd == 'VER':
-                    print(f"\n  {Style.BRIGHT_YELLOW}GEMINI-1 MONITOR v2.0.0{Style.RESET}")
-                    print(f"  {Style.DIM}(C) 1983 GEMINI CORPORATION{Style.RESET}")
-                    print(f"  {Style.DIM}Enhanced Edition - 2024{Style.RESET}\n")
-                
+                handler = self._commands.get(cmd)
+                if handler is not None:
+                    handler(cmd, args)
                 else:
                     print(f"  {Style.BRIGHT_RED}Unknown command: {cmd}{Style.RESET}")
                     print(f"  {Style.DIM}Type 'HELP' for available commands{Style.RESET}")
@@ -1644,175 +2019,424 @@ class GEMINIShell:
         except KeyboardInterrupt:
             print(f"\n  {Style.BRIGHT_CYAN}Exiting shell...{Style.RESET}\n")
 
-def show_game_menu(high_score_manager: HighScoreManager) -> Optional[int]:
-    """Show game selection menu with enhanced visuals"""
-    games = [
-        ("Snake", "Classic snake game - eat and grow!", Style.GREEN, "🐍"),
-        ("Pong", "Keep the ball in play!", Style.CYAN, "🔵"),
-        ("Breakout", "Break all the bricks!", Style.RED, "🧱"),
-        ("Racing", "Dodge obstacles on the road!", Style.MAGENTA, "🏎️"),
-        ("Pac-Man", "Eat all dots, avoid the ghosts!", Style.YELLOW, "😮"),
-        ("CLI", "System Monitor", Style.DIM, "💻")
-    ]
+    # Command handlers: each receives the upper-cased command word and its arguments.
 
-    print("\033[2J\033[H")
-    banner = Style.gradient_text(
-        " GEMINI-1  ARCADE ",
-        [Style.BRIGHT_MAGENTA, Style.BRIGHT_BLUE, Style.BRIGHT_CYAN, Style.BRIGHT_GREEN, Style.BRIGHT_YELLOW],
-    )
-    print(f"      {Style.BRIGHT_BLACK}{'▄' * 38}{Style.RESET}")
-    print(f"      {Style.BRIGHT_BLACK}▌{Style.RESET}{banner:<36}{Style.BRIGHT_BLACK}▐{Style.RESET}")
-    print(f"      {Style.BRIGHT_BLACK}{'▀' * 38}{Style.RESET}")
-    print(f"      {Style.DIM}Select a game to boot:{Style.RESET}\n")
+    def _cmd_exit(self, cmd: str, args: List[str]):
+        self.running = False
+        print(f"\n  {Style.BRIGHT_CYAN}Exiting shell...{Style.RESET}\n")
 
-    for i, (name, desc, color, icon) in enumerate(games, 1):
-        high_score = high_score_manager.get_high_score(name)
+    def _cmd_help(self, cmd: str, args: List[str]):
+        self.print_help()
 
-        if name != "CLI":
-            entry = f"{Style.BRIGHT_YELLOW}[{i}]{Style.RESET} {color}{icon}{Style.RESET} {Style.BRIGHT_WHITE}{name:<10}{Style.RESET}  High: {Style.BRIGHT_GREEN}{high_score:>5}{Style.RESET}"
+    def _cmd_status(self, cmd: str, args: List[str]):
+        self.print_status()
+
+    def _cmd_regs(self, cmd: str, args: List[str]):
+        self.print_registers()
+
+    def _cmd_mem(self, cmd: str, args: List[str]):
+        if not args:
+            print(f"  {Style.BRIGHT_RED}Usage: {cmd} <address>{Style.RESET}")
         else:
-            entry = f"{Style.BRIGHT_YELLOW}[{i}]{Style.RESET} {color}{icon}{Style.RESET} {Style.BRIGHT_WHITE}{name:<10}{Style.RESET}  {Style.DIM}(System Monitor){Style.RESET}"
+            addr = self.parse_number(args[0])
+            if addr is not None:
+                self.read_memory(addr)
+            else:
+                print(f"  {Style.BRIGHT_RED}ERROR: Invalid address{Style.RESET}")
+
+    def _cmd_poke(self, cmd: str, args: List[str]):
+        if len(args) < 2:
+            print(f"  {Style.BRIGHT_RED}Usage: POKE <address> <value>{Style.RESET}")
+        else:
+            addr = self.parse_number(args[0])
+            val = self.parse_number(args[1])
+            if addr is not None and val is not None:
+                self.write_memory(addr, val)
+            else:
+                print(f"  {Style.BRIGHT_RED}ERROR: Invalid address or value{Style.RESET}")
+
+    def _cmd_dump(self, cmd: str, args: List[str]):
+        if len(args) < 2:
+            print(f"  {Style.BRIGHT_RED}Usage: DUMP <start> <end>{Style.RESET}")
+        else:
+            start = self.parse_number(args[0])
+            end = self.parse_number(args[1])
+            if start is not None and end is not None:
+                self.dump_memory(start, end)
+            else:
+                print(f"  {Style.BRIGHT_RED}ERROR: Invalid addresses{Style.RESET}")
+
+    def _cmd_fill(self, cmd: str, args: List[str]):
+        if len(args) < 3:
+            print(f"  {Style.BRIGHT_RED}Usage: FILL <start> <end> <value>{Style.RESET}")
+        else:
+            start = self.parse_number(args[0])
+            end = self.parse_number(args[1])
+            val = self.parse_number(args[2])
+            if start is not None and end is not None and val is not None:
+                start = max(start, 0)
+                stop = min(end + 1, len(self.cpu.memory))
+                if start < stop:
+                    self.cpu.memory[start:stop] = bytes((val & 0xFF,)) * (stop - start)
+                print(f"  {Style.BRIGHT_GREEN}✓{Style.RESET} Filled memory range with {Style.BRIGHT_YELLOW}0x{val:02X}{Style.RESET}")
+            else:
+                print(f"  {Style.BRIGHT_RED}ERROR: Invalid parameters{Style.RESET}")
+
+    def _cmd_vram(self, cmd: str, args: List[str]):
+        self.display_vram()
+
+    def _cmd_reset(self, cmd: str, args: List[str]):
+        self.cpu.A = self.cpu.B = self.cpu.C = self.cpu.D = 0
+        self.cpu.PC = 0
+        self.cpu.SP = self.cpu.STACK_TOP
+        self.cpu.zero_flag = False
+        self.cpu.carry_flag = False
+        self.cpu.running = True
+        print(f"  {Style.BRIGHT_GREEN}✓ CPU reset{Style.RESET}")
+
+    def _cmd_run(self, cmd: str, args: List[str]):
+        start_addr = 0
+        if args:
+            addr = self.parse_number(args[0])
+            if addr is not None:
+                start_addr = addr
+
+        self.cpu.PC = start_addr
+        self.cpu.running = True
+        print(f"  {Style.BRIGHT_GREEN}Running from address 0x{start_addr:04X}...{Style.RESET}")
+
+        steps = self.cpu.run(1000)
+
+        print(f"  {Style.BRIGHT_GREEN}✓ Executed {steps} instructions{Style.RESET}")
 
-        print(f"      {entry}")
+    def _cmd_step(self, cmd: str, args: List[str]):
+        n = 1
+        if args:
+            n_val = self.parse_number(args[0])
+            if n_val is not None:
+                n = n_val
 
-        print(f"          {Style.DIM}{desc}{Style.RESET}")
+        self.cpu.run(n)
+
+        print(f"  {Style.BRIGHT_GREEN}✓ Stepped {n} instruction(s){Style.RESET}")
+        self.print_status()
+
+    def _cmd_demo(self, cmd: str, args: List[str]):
+        self.run_demo()
+
+    def _cmd_info(self, cmd: str, args: List[str]):
+        self.show_info()
+
+    def _cmd_history(self, cmd: str, args: List[str]):
+        print(f"\n  {Style.BRIGHT_WHITE}Command History:{Style.RESET}\n")
+        for i, h in enumerate(self.history[-20:], 1):
+            print(f"  {Style.DIM}{i:3d}.{Style.RESET} {h}")
         print()
 
-    print(f"      {Style.BRIGHT_YELLOW}[Q]{Style.RESET} {Style.BRIGHT_WHITE}Quit{Style.RESET}")
-    print()
+    def _cmd_clear(self, cmd: str, args: List[str]):
+        print("\033[2J\033[H")
+        self.print_banner()
 
-    print(f"{Style.BRIGHT_WHITE}  > {Style.BRIGHT_WHITE}Select option (1-6) or Q to quit:{Style.RESET} ", end='', flush=True)
+    def _cmd_ver(self, cmd: str, args: List[str]):
+        print(f"\n  {Style.BRIGHT_YELLOW}GEMINI-1 MONITOR v2.0.0{Style.RESET}")
+        print(f"  {Style.DIM}(C) 1983 GEMINI CORPORATION{Style.RESET}")
+        print(f"  {Style.DIM}Enhanced Edition - 2024{Style.RESET}\n")
+
+
+def _write_bytes(data: bytes):
+    """Write pre-encoded output straight to the stdout byte buffer and flush"""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        sys.stdout.flush()
+        return
+    # Flush pending text-layer output first so ordering is preserved
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _write_lines(lines: List[bytes], end: bytes = b"\n"):
+    """Write a block of pre-encoded lines to the terminal in one write and flush"""
+    _write_bytes(b"\n".join(lines) + end)
+
+
+# Game menu entries: (name, description, color, icon)
+_MENU_GAMES = (
+    ("Snake", "Classic snake game - eat and grow!", Style.GREEN, "🐍"),
+    ("Pong", "Keep the ball in play!", Style.CYAN, "🔵"),
+    ("Breakout", "Break all the bricks!", Style.RED, "🧱"),
+    ("Racing", "Dodge obstacles on the road!", Style.MAGENTA, "🏎️"),
+    ("Pac-Man", "Eat all dots, avoid the ghosts!", Style.YELLOW, "😮"),
+    ("CLI", "System Monitor", Style.DIM, "💻")
+)
+
+# Static menu text, formatted once; only the high scores change between redraws
+_MENU_BANNER = Style.gradient_text(
+    " GEMINI-1  ARCADE ",
+    [Style.BRIGHT_MAGENTA, Style.BRIGHT_BLUE, Style.BRIGHT_CYAN, Style.BRIGHT_GREEN, Style.BRIGHT_YELLOW],
+)
+_MENU_HEADER = "\n".join([
+    "\033[2J\033[H",
+    f"      {Style.BRIGHT_BLACK}{'▄' * 38}{Style.RESET}",
+    f"      {Style.BRIGHT_BLACK}▌{Style.RESET}{_MENU_BANNER:<36}{Style.BRIGHT_BLACK}▐{Style.RESET}",
+    f"      {Style.BRIGHT_BLACK}{'▀' * 38}{Style.RESET}",
+    f"      {Style.DIM}Select a game to boot:{Style.RESET}\n",
+]).encode()
+# Per-entry lines with a {score} placeholder for games that keep a high score
+_MENU_ENTRIES = tuple(
+    (name,
+     f"      {Style.BRIGHT_YELLOW}[{i}]{Style.RESET} {color}{icon}{Style.RESET} {Style.BRIGHT_WHITE}{name:<10}{Style.RESET}  "
+     + (f"High: {Style.BRIGHT_GREEN}{{score:>5}}{Style.RESET}" if name != "CLI" else f"{Style.DIM}(System Monitor){Style.RESET}")
+     + f"\n          {Style.DIM}{desc}{Style.RESET}\n")
+    for i, (name, desc, color, icon) in enumerate(_MENU_GAMES, 1)
+)
+# Menu key -> zero-based choice index
+_MENU_KEYS = {str(i): i - 1 for i in range(1, len(_MENU_GAMES) + 1)}
+_MENU_FOOTER = "\n".join([
+    f"      {Style.BRIGHT_YELLOW}[Q]{Style.RESET} {Style.BRIGHT_WHITE}Quit{Style.RESET}",
+    "",
+    f"{Style.BRIGHT_WHITE}  > {Style.BRIGHT_WHITE}Select option (1-6) or Q to quit:{Style.RESET} ",
+]).encode()
+
+
+@lru_cache(maxsize=4)
+def _menu_frame(scores: Tuple[int, ...]) -> bytes:
+    """Build the full encoded menu for one snapshot of per-entry high scores"""
+    lines = [_MENU_HEADER]
+    for (name, entry), score in zip(_MENU_ENTRIES, scores):
+        if name != "CLI":
+            entry = entry.format(score=score)
+        lines.append(entry.encode())
+    lines.append(_MENU_FOOTER)
+    return b"\n".join(lines)
+
+
+def show_game_menu(high_score_manager: HighScoreManager) -> Optional[int]:
+    """Show game selection menu with enhanced visuals"""
+    # Read the scores once; the encoded menu is reused until one of them changes
+    scores = tuple(high_score_manager.get_high_score(name) for name, _ in _MENU_ENTRIES)
+    _write_bytes(_menu_frame(scores))
 
     try:
         with InputHandler() as handler:
             while True:
+                handler.wait()
                 key = handler.get_input()
                 if key:
-                    if key in ['1', '2', '3', '4', '5', '6']:
-                        return int(key) - 1
+                    choice = _MENU_KEYS.get(key)
+                    if choice is not None:
+                        return choice
                     elif key == 'q':
                         return None
-                time.sleep(0.01)
     except KeyboardInterrupt:
         return None
 
 
+@lru_cache(maxsize=8)
+def _lives_info(lives: int) -> str:
+    """Breakout status line: remaining lives as filled/empty pips"""
+    return f"Lives: {Style.RED}{'●' * lives}{Style.DIM}{'○' * (3 - lives)}{Style.RESET}"
+
+
+@lru_cache(maxsize=512)
+def _pacman_info(lives: int, dots_remaining: int, total_dots: int, powered: bool) -> str:
+    """Pac-Man status line: lives, dots left and the power-pellet indicator"""
+    power = f"{Style.BRIGHT_YELLOW}{Style.BLINK}POWER!{Style.RESET}" if powered else ""
+    return f"Lives: {lives} | Dots: {dots_remaining}/{total_dots} {power}"
+
+
+@lru_cache(maxsize=64)
+def _speed_info(game_speed: float) -> str:
+    """Snake status line: current speed"""
+    return f"Speed: {int(1 / game_speed * 10)}"
+
+
+# Per-game status line builders, chosen once per run_game instead of per frame
+_INFO_BUILDERS = {
+    BreakoutGame: lambda game: _lives_info(game.lives),
+    PacManGame: lambda game: _pacman_info(game.lives, game.dots_remaining, game.total_dots, game.power_mode > 0),
+    SnakeGame: lambda game: _speed_info(game.game_speed),
+}
+
+
+# Pre-encoded static rows of the loading box and the game-over panel
+_LOADER_EDGE = f"  +{Style.BRIGHT_BLACK}─{'─' * 28}─+{Style.RESET}".encode()
+_PANEL_EDGE = f"      +{Style.BRIGHT_BLACK}─{'─' * 34}─+{Style.RESET}".encode()
+_PANEL_BLANK = f"      {Style.BRIGHT_BLACK}│{Style.RESET}{' ' * 36}{Style.BRIGHT_BLACK}│{Style.RESET}".encode()
+_PANEL_TITLE, _PANEL_NEW_RECORD_TITLE = (
+    f"      {Style.BRIGHT_BLACK}│{Style.RESET}  {color}{Style.BOLD}*** GAME OVER ***{Style.RESET}                 {Style.BRIGHT_BLACK}│{Style.RESET}".encode()
+    for color in (Style.BRIGHT_YELLOW, Style.BRIGHT_RED)
+)
+_PANEL_FINAL_SCORE = f"      {Style.BRIGHT_BLACK}│{Style.RESET}  {Style.DIM}FINAL SCORE:{Style.RESET}                      {Style.BRIGHT_BLACK}│{Style.RESET}".encode()
+_PANEL_HIGH_SCORE = f"      {Style.BRIGHT_BLACK}│{Style.RESET}  {Style.DIM}HIGH SCORE:{Style.RESET}                       {Style.BRIGHT_BLACK}│{Style.RESET}".encode()
+_PANEL_NEW_RECORD = f"      {Style.BRIGHT_BLACK}│{Style.RESET}      {Style.BRIGHT_YELLOW}{Style.BLINK}*** NEW HIGH SCORE ***{Style.RESET}        {Style.BRIGHT_BLACK}│{Style.RESET}".encode()
+_PANEL_CONTINUE = f"      {Style.DIM}Press any key to continue...{Style.RESET}".encode()
+
+
+def _panel_value_row(text: str, color: str) -> bytes:
+    """Game-over panel row with text centered in the 32-column interior and highlighted"""
+    inner = f"{text:^32}".replace(text, f"{color}{Style.BOLD}{text}{Style.RESET}", 1)
+    return f"      {Style.BRIGHT_BLACK}│{Style.RESET}{inner}    {Style.BRIGHT_BLACK}│{Style.RESET}".encode()
+
+
 def run_game(game: Game):
     """Run a game with enhanced visuals"""
     print("\033[2J\033[H")
 
     loading_chars = ["/", "-", "\\", "|"]
+    loading_colors = [Style.CYAN, Style.GREEN, Style.YELLOW, Style.MAGENTA]
     game_name = game.get_name()
+    bold, reset = Style.BOLD, Style.RESET
+
+    # Spinner char and color both cycle with period 4, so there are only four distinct
+    # repaints of the title (row 2 col 6) and spinner (row 3 col 10); build them up front
+    # along with the cursor parked below the box again
+    spinner_frames = [
+        f"\033[2;6H{color}{bold}{game_name:^26}{reset}\033[3;10H{color}{char} LOADING...{reset}\033[5;1H".encode()
+        for char, color in zip(loading_chars, loading_colors)
+    ]
 
+    # Draw the loading box once; later ticks only repaint the recolored cells
     for i in range(15):
-        char = loading_chars[i % len(loading_chars)]
-        color = [Style.CYAN, Style.GREEN, Style.YELLOW, Style.MAGENTA][i % 4]
-        print(f"\033[H  +{Style.BRIGHT_BLACK}─{'─' * 28}─+{Style.RESET}")
-        print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}  {color}{Style.BOLD}{game_name:^26}{Style.RESET}  {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}      {color}{char} LOADING...{Style.RESET}            {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"  +{Style.BRIGHT_BLACK}─{'─' * 28}─+{Style.RESET}")
+        if i == 0:
+            side = f"  {Style.BRIGHT_BLACK}│{reset}"
+            color = loading_colors[0]
+            _write_lines([
+                b"\033[H" + _LOADER_EDGE,
+                f"{side}  {color}{bold}{game_name:^26}{reset}  {Style.BRIGHT_BLACK}│{reset}".encode(),
+                f"{side}      {color}{loading_chars[0]} LOADING...{reset}            {Style.BRIGHT_BLACK}│{reset}".encode(),
+                _LOADER_EDGE,
+            ])
+        else:
+            _write_bytes(spinner_frames[i % 4])
         time.sleep(0.08)
 
-    last_update = time.time()
+    # Tick timing on the monotonic integer clock; tick_ns is refreshed whenever
+    # update() or reset() may have changed game_speed
+    last_update = time.monotonic_ns()
+    tick_ns = int(game.game_speed * 1_000_000_000)
     paused = False
+    build_info = _INFO_BUILDERS.get(type(game))
 
     try:
         with InputHandler() as input_handler:
-            while game.cpu.running and not game.game_over:
-                info_str = ""
-                if isinstance(game, BreakoutGame):
-                    lives_display = f"{Style.RED}{'●' * game.lives}{Style.DIM}{'○' * (3 - game.lives)}{Style.RESET}"
-                    info_str = f"Lives: {lives_display}"
-                elif isinstance(game, PacManGame):
-                    power = f"{Style.BRIGHT_YELLOW}{Style.BLINK}POWER!{Style.RESET}" if game.power_mode > 0 else ""
-                    info_str = f"Lives: {game.lives} | Dots: {game.dots_remaining}/{game.total_dots} {power}"
-                elif isinstance(game, SnakeGame):
-                    info_str = f"Speed: {int(1 / game.game_speed * 10)}"
-
-                game.cpu.render(title=game.get_name(), paused=paused, info=info_str)
-
-                key = input_handler.get_input()
-                if key:
-                    if key in ('q', '0'):
-                        game.cpu.running = False
-                    elif key in ('r', '9'):
+            # Bind everything the loop touches per iteration to locals
+            cpu = game.cpu
+            render = cpu.render
+            title = game.get_name()
+            wait = input_handler.wait
+            get_input = input_handler.get_input
+            handle_input = game.handle_input
+            update = game.update
+            monotonic_ns = time.monotonic_ns
+
+            while cpu.running and not game.game_over:
+                info_str = build_info(game) if build_info else ""
+                render(title=title, paused=paused, info=info_str)
+
+                # Sleep until a key arrives or the next tick is due
+                if paused:
+                    wait()
+                else:
+                    wait(max(0, last_update + tick_ns - monotonic_ns()) / 1_000_000_000)
+
+                # Handle every key already waiting, so a burst of keystrokes costs one render
+                key = get_input()
+                while key:
+                    if key in {'q', '0'}:
+                        cpu.running = False
+                        break
+                    elif key in {'r', '9'}:
                         game.reset()
+                        tick_ns = int(game.game_speed * 1_000_000_000)
                         paused = False
                     elif key == 'p':
                         paused = not paused
                     elif not paused:
-                        game.handle_input(key)
+                        handle_input(key)
+                    key = get_input()
 
                 if not paused:
-                    current_time = time.time()
-                    if current_time - last_update >= game.game_speed:
-                        game.update()
-                        last_update = current_time
-
-                time.sleep(0.01)
+                    now = monotonic_ns()
+                    due = last_update + tick_ns
+                    if now >= due:
+                        update()
+                        tick_ns = int(game.game_speed * 1_000_000_000)
+                        # Advance along the tick grid so late wakeups don't accumulate as
+                        # drift; after a stall of a whole tick or more, resync to now
+                        last_update = due if now - due < tick_ns else now
 
     except KeyboardInterrupt:
         pass
 
+    game.high_score_manager.flush()
+
     if game.game_over:
         time.sleep(0.5)
-        print("\033[2J\033[H")
         high_score = game.high_score_manager.get_high_score(game.get_name())
         is_new_record = game.score == high_score and game.score > 0
 
-        top_color = Style.BRIGHT_RED if is_new_record else Style.BRIGHT_YELLOW
-
-        box_width = 36
-        print()
-        print(f"      +{Style.BRIGHT_BLACK}─{'─' * (box_width - 2)}─+{Style.RESET}")
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}  {top_color}{Style.BOLD}*** GAME OVER ***{Style.RESET}                 {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}  {Style.DIM}FINAL SCORE:{Style.RESET}                      {Style.BRIGHT_BLACK}│{Style.RESET}")
-
-        score_str = f"{game.score:,}"
-        score_padding = (box_width - 4 - len(score_str)) // 2
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}{' ' * score_padding}{Style.BRIGHT_GREEN}{Style.BOLD}{score_str}{Style.RESET}{' ' * (box_width - 4 - score_padding - len(score_str))}    {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}  {Style.DIM}HIGH SCORE:{Style.RESET}                       {Style.BRIGHT_BLACK}│{Style.RESET}")
-
-        high_str = f"{high_score:,}"
-        high_padding = (box_width - 4 - len(high_str)) // 2
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}{' ' * high_padding}{Style.BRIGHT_CYAN}{Style.BOLD}{high_str}{Style.RESET}{' ' * (box_width - 4 - high_padding - len(high_str))}    {Style.BRIGHT_BLACK}│{Style.RESET}")
-
+        lines = [
+            b"\033[2J\033[H",
+            b"",
+            _PANEL_EDGE,
+            _PANEL_BLANK,
+            _PANEL_NEW_RECORD_TITLE if is_new_record else _PANEL_TITLE,
+            _PANEL_BLANK,
+            _PANEL_FINAL_SCORE,
+            _panel_value_row(f"{game.score:,}", Style.BRIGHT_GREEN),
+            _PANEL_BLANK,
+            _PANEL_HIGH_SCORE,
+            _panel_value_row(f"{high_score:,}", Style.BRIGHT_CYAN),
+        ]
         if is_new_record:
-            print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
-            print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}      {Style.BRIGHT_YELLOW}{Style.BLINK}*** NEW HIGH SCORE ***{Style.RESET}        {Style.BRIGHT_BLACK}│{Style.RESET}")
-
-        print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
-        print(f"      +{Style.BRIGHT_BLACK}─{'─' * (box_width - 2)}─+{Style.RESET}")
-
-        print()
-        print(f"      {Style.DIM}Press any key to continue...{Style.RESET}")
+            lines += (_PANEL_BLANK, _PANEL_NEW_RECORD)
+        lines += (_PANEL_BLANK, _PANEL_EDGE, b"", _PANEL_CONTINUE)
+        _write_lines(lines)
 
         try:
             with InputHandler() as handler:
                 while True:
+                    handler.wait()
                     if handler.get_input():
                         break
-                    time.sleep(0.01)
         except KeyboardInterrupt:
             pass
 
 
+# Pre-encoded static blocks of the boot screen
+_BOOT_HEADER = "\n".join([
+    "\033[2J\033[H",
+    "",
+    f"      {Style.BRIGHT_CYAN}{Style.BOLD}G E M I N I - 1   A R C A D E{Style.RESET}",
+    "",
+    f"      {Style.DIM}{'─' * 40}{Style.RESET}",
+]).encode()
+_BOOT_BOX_TOP = "\n".join([
+    "",
+    f"      +{Style.BRIGHT_BLACK}─{'─' * 36}─+{Style.RESET}",
+    f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"      {Style.BRIGHT_BLACK}│{Style.RESET}      LOADING ARCADE...            {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}",
+]).encode()
+_BOOT_BOX_BOTTOM = "\n".join([
+    f"\r      {Style.BRIGHT_BLACK}│{Style.RESET}      {Style.BRIGHT_GREEN}▒▒▒▒▒▒▒▒▒▒{Style.RESET} COMPLETE!       {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"      +{Style.BRIGHT_BLACK}─{'─' * 36}─+{Style.RESET}",
+    "",
+    f"      {Style.BRIGHT_CYAN}{Style.BOLD}PRESS ANY KEY TO ENTER{Style.RESET}",
+    f"      {Style.DIM}(or wait 3 seconds...){Style.RESET}",
+]).encode()
+
+
 def show_boot_animation(cpu: GeminiCPU):
     """Show enhanced boot animation"""
-    print("\033[2J\033[H")
-
     boot_colors = [
         Style.BRIGHT_RED, Style.BRIGHT_YELLOW, Style.GREEN,
         Style.CYAN, Style.BRIGHT_BLUE, Style.MAGENTA
     ]
 
-    print()
-    print(f"      {Style.BRIGHT_CYAN}{Style.BOLD}G E M I N I - 1   A R C A D E{Style.RESET}")
-    print()
-    print(f"      {Style.DIM}{'─' * 40}{Style.RESET}")
+    _write_lines([_BOOT_HEADER])
 
     boot_messages = [
         (Style.BRIGHT_WHITE, "INITIALIZING SYSTEM...", 0.04),
@@ -1824,44 +2448,66 @@ def show_boot_animation(cpu: GeminiCPU):
         (Style.BRIGHT_GREEN, "SYSTEM READY!", 0.1),
     ]
 
+    reset = Style.RESET
     for color, msg, delay in boot_messages:
-        print(f"      {color}> {msg}{Style.RESET}")
+        print(f"      {color}> {msg}{reset}")
         time.sleep(delay)
 
     print(f"      {Style.DIM}{'─' * 40}{Style.RESET}")
     time.sleep(0.3)
 
-    print()
-    print(f"      +{Style.BRIGHT_BLACK}─{'─' * 36}─+{Style.RESET}")
-    print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
-    print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}      LOADING ARCADE...            {Style.BRIGHT_BLACK}│{Style.RESET}")
-    print(f"      {Style.BRIGHT_BLACK}│{Style.RESET}                                    {Style.BRIGHT_BLACK}│{Style.RESET}")
+    _write_lines([_BOOT_BOX_TOP])
 
     boot_progress = ["░░░░░░░░░", "▒▒░░░░░░░", "▒▒▒░░░░░░", "▒▒▒▒░░░░░", "▒▒▒▒▒░░░░", "▒▒▒▒▒▒░░░",
                      "▒▒▒▒▒▒▒░░", "▒▒▒▒▒▒▒▒░", "▒▒▒▒▒▒▒▒▒"]
+    green = Style.BRIGHT_GREEN
     for i, prog in enumerate(boot_progress):
-        print(f"\r      {Style.BRIGHT_BLACK}│{Style.RESET}      {Style.BRIGHT_GREEN}{prog}{Style.RESET} LOADING...       {Style.BRIGHT_BLACK}│{Style.RESET}", end='', flush=True)
+        if i == 0:
+            print(f"\r      {Style.BRIGHT_BLACK}│{reset}      {green}{prog}{reset} LOADING...       {Style.BRIGHT_BLACK}│{reset}", end='', flush=True)
+        else:
+            # Only the bar (columns 14-22) changes between steps; return to the line end after it
+            print(f"\033[14G{green}{prog}{reset}\033[42G", end='', flush=True)
         time.sleep(0.05)
 
-    print(f"\r      {Style.BRIGHT_BLACK}│{Style.RESET}      {Style.BRIGHT_GREEN}▒▒▒▒▒▒▒▒▒▒{Style.RESET} COMPLETE!       {Style.BRIGHT_BLACK}│{Style.RESET}")
-    print(f"      +{Style.BRIGHT_BLACK}─{'─' * 36}─+{Style.RESET}")
-
-    print()
-    print(f"      {Style.BRIGHT_CYAN}{Style.BOLD}PRESS ANY KEY TO ENTER{Style.RESET}")
-    print(f"      {Style.DIM}(or wait 3 seconds...){Style.RESET}", end='', flush=True)
+    _write_lines([_BOOT_BOX_BOTTOM], end=b'')
 
     try:
         import select
-        start = time.time()
-        while time.time() - start < 3:
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                sys.stdin.read(1)
-                break
+        if select.select([sys.stdin], [], [], 3)[0]:
+            sys.stdin.read(1)
     except:
         pass
 
     time.sleep(0.5)
 
+# Menu choice index -> game class (choice 5 is the shell)
+_GAME_CLASSES = (SnakeGame, PongGame, BreakoutGame, RacingGame, PacManGame)
+
+# Pre-encoded "thank you" box shown on quit, ending with the indent for the farewell message
+_FAREWELL_PANEL = "\n".join([
+    "\033[2J\033[H",
+    "",
+    f"  +{Style.BRIGHT_BLACK}─{'─' * 42}─+{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}        {Style.BRIGHT_WHITE}{Style.BOLD}  THANK YOU FOR PLAYING!{Style.RESET}            {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}             {Style.BRIGHT_CYAN}GEMINI-1 ARCADE{Style.RESET}                {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}       {Style.BRIGHT_YELLOW}{Style.BLINK}*** *** *** *** *** *** *** ***{Style.RESET}      {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}",
+    f"  +{Style.BRIGHT_BLACK}─{'─' * 42}─+{Style.RESET}",
+    "",
+    "  ",
+]).encode()
+
+# Farewell message, one pre-encoded rainbow-colored character per animation step
+_GOODBYE_COLORS = (Style.RED, Style.ORANGE, Style.YELLOW, Style.GREEN, Style.CYAN, Style.BLUE, Style.MAGENTA)
+_GOODBYE_CHARS = tuple(
+    f"{_GOODBYE_COLORS[i % len(_GOODBYE_COLORS)]}{char}{Style.RESET}".encode()
+    for i, char in enumerate("SEE YOU NEXT TIME!")
+)
+
+
 def main():
     """Main program with enhanced styling"""
     if not sys.stdin.isatty() and os.name != 'nt':
@@ -1872,35 +2518,20 @@ def main():
     high_score_manager = HighScoreManager()
     config = GameConfig()
 
-    temp_cpu = GeminiCPU(framebuffer_width=config.width,
-                         framebuffer_height=config.height)
-    show_boot_animation(temp_cpu)
+    # The boot animation takes ~1.5 s; allow skipping it for scripted or repeat launches
+    if "--no-boot" not in sys.argv[1:] and not os.environ.get("ARGOE_FAST_BOOT"):
+        temp_cpu = GeminiCPU(framebuffer_width=config.width,
+                             framebuffer_height=config.height)
+        show_boot_animation(temp_cpu)
 
     try:
         while True:
             choice = show_game_menu(high_score_manager)
 
             if choice is None:
-                print("\033[2J\033[H")
-
-                print()
-                print(f"  +{Style.BRIGHT_BLACK}─{'─' * 42}─+{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}        {Style.BRIGHT_WHITE}{Style.BOLD}  THANK YOU FOR PLAYING!{Style.RESET}            {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}             {Style.BRIGHT_CYAN}GEMINI-1 ARCADE{Style.RESET}                {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}       {Style.BRIGHT_YELLOW}{Style.BLINK}*** *** *** *** *** *** *** ***{Style.RESET}      {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  {Style.BRIGHT_BLACK}│{Style.RESET}                                            {Style.BRIGHT_BLACK}│{Style.RESET}")
-                print(f"  +{Style.BRIGHT_BLACK}─{'─' * 42}─+{Style.RESET}")
-                print()
-
-                colors = [Style.RED, Style.ORANGE, Style.YELLOW, Style.GREEN, Style.CYAN, Style.BLUE, Style.MAGENTA]
-                goodbye = "SEE YOU NEXT TIME!"
-                print("  ")
-                for i, char in enumerate(goodbye):
-                    color = colors[i % len(colors)]
-                    print(f"{color}{char}{Style.RESET}", end='', flush=True)
+                _write_lines([_FAREWELL_PANEL])
+                for char_bytes in _GOODBYE_CHARS:
+                    _write_bytes(char_bytes)
                     time.sleep(0.05)
                 print()
                 print()
@@ -1914,15 +2545,7 @@ def main():
                 shell.run()
                 continue
 
-            games = [
-                SnakeGame(cpu, high_score_manager),
-                PongGame(cpu, high_score_manager),
-                BreakoutGame(cpu, high_score_manager),
-                RacingGame(cpu, high_score_manager),
-                PacManGame(cpu, high_score_manager)
-            ]
-
-            run_game(games[choice])
+            run_game(_GAME_CLASSES[choice](cpu, high_score_manager))
 
     except KeyboardInterrupt:
         print(f"\n\n{Style.BRIGHT_YELLOW}Game interrupted. Bye!{Style.RESET}")